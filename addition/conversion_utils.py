@@ -6,16 +6,36 @@ and Float_4E3M bit representations, including rounding to the nearest
 representable value.
 """
 
+import sys
+import time
+import numpy as np
 from typing import Tuple
 from float_4e3m import Float_4E3M
 
 
+# Precomputed lookup tables indexed by the 8-bit pattern (0-255).
+# Built once at import so decoding never constructs Float_4E3M objects.
+_BITS_TO_VALUE = tuple(Float_4E3M.from_bits(i).value for i in range(256))
+_BITS_TO_SIGN = tuple((i >> 7) & 1 for i in range(256))
+_BITS_TO_EXP = tuple((i >> 3) & 0xF for i in range(256))
+_BITS_TO_MANT = tuple(i & 0x7 for i in range(256))
+
+_BITSTRINGS = tuple(f"{i:08b}" for i in range(256))
+
+# Reverse lookup from canonical 8-character bitstrings to their integer pattern
+_BITSTRING_TO_BITS = {bitstring: i for i, bitstring in enumerate(_BITSTRINGS)}
+
+# All representable values as an array, for vectorized decoding
+_VALUE_ARRAY = np.array(_BITS_TO_VALUE, dtype=np.float64)
+
+
 def value_to_bitstream(value: float) -> str:
     """
     Convert a float value to Float_4E3M bitstream representation.
     
     This function finds the closest Float_4E3M representation for the given value
-    by trying all possible combinations and selecting the one with minimum error.
+    by encoding its exponent and significand directly (see
+    Float_4E3M.bits_from_value).
     
     Args:
         value (float): The value to convert
@@ -23,8 +43,7 @@ def value_to_bitstream(value: float) -> str:
     Returns:
         str: 8-bit binary string representation (e.g., "10110000")
     """
-    float_4e3m = Float_4E3M.from_value(value)
-    return float_4e3m.to_bitstring()
+    return _BITSTRINGS[Float_4E3M.bits_from_value(value)]
 
 
 def value_to_components(value: float) -> Tuple[int, int, int]:
@@ -37,8 +56,8 @@ def value_to_components(value: float) -> Tuple[int, int, int]:
     Returns:
         Tuple[int, int, int]: (sign, exponent, mantissa) components
     """
-    float_4e3m = Float_4E3M.from_value(value)
-    return float_4e3m.sign, float_4e3m.exponent, float_4e3m.mantissa
+    bits = Float_4E3M.bits_from_value(value)
+    return _BITS_TO_SIGN[bits], _BITS_TO_EXP[bits], _BITS_TO_MANT[bits]
 
 
 def bitstream_to_value(bitstream: str) -> float:
@@ -54,10 +73,29 @@ def bitstream_to_value(bitstream: str) -> float:
     if len(bitstream) != 8:
         raise ValueError("Bitstream must be exactly 8 bits")
     
-    # Convert binary string to integer
-    bits = int(bitstream, 2)
-    float_4e3m = Float_4E3M.from_bits(bits)
-    return float_4e3m.value
+    # Convert binary string to integer and look up the precomputed value.
+    # A dict hit avoids parsing; anything else is parsed with int() and
+    # range-checked by bits_to_value (e.g. "-0000001" is rejected).
+    bits = _BITSTRING_TO_BITS.get(bitstream)
+    if bits is None:
+        return bits_to_value(int(bitstream, 2))
+    return _BITS_TO_VALUE[bits]
+
+
+def bits_to_value(bits: int) -> float:
+    """
+    Convert an 8-bit integer pattern to its Float_4E3M value.
+    
+    Args:
+        bits (int): 8-bit integer (0-255)
+        
+    Returns:
+        float: The corresponding Float_4E3M value
+    """
+    if not (0 <= bits <= 255):
+        raise ValueError("Bits must be between 0 and 255 (8 bits)")
+    
+    return _BITS_TO_VALUE[bits]
 
 
 def demonstrate_conversion(test_values: list) -> None:
@@ -67,40 +105,149 @@ def demonstrate_conversion(test_values: list) -> None:
     Args:
         test_values (list): List of float values to test
     """
-    print("Value Conversion Demonstration")
-    print("=" * 60)
-    print("Original Value | Sign | Exp | Mant | Bitstream | Converted Value | Error")
-    print("-" * 80)
+    lines = [
+        "Value Conversion Demonstration",
+        "=" * 60,
+        "Original Value | Sign | Exp | Mant | Bitstream | Converted Value | Error",
+        "-" * 80,
+    ]
     
     for value in test_values:
-        # Convert to Float_4E3M
+        # Convert to Float_4E3M once and format the row from that object
         float_4e3m = Float_4E3M.from_value(value)
+        sign, exponent, mantissa = float_4e3m.sign, float_4e3m.exponent, float_4e3m.mantissa
         bitstream = float_4e3m.to_bitstring()
         converted_value = float_4e3m.value
         error = abs(value - converted_value)
         
-        print(f"{value:13.6f} |  {float_4e3m.sign}   | {float_4e3m.exponent:2d}  |  {float_4e3m.mantissa}  | {bitstream} | {converted_value:14.6f} | {error:.6f}")
+        lines.append(f"{value:13.6f} |  {sign}   | {exponent:2d}  |  {mantissa}  | {bitstream} | {converted_value:14.6f} | {error:.6f}")
+    
+    # Emit the whole table with a single write
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
-def find_conversion_errors(test_values: list) -> list:
+def values_to_bits(values) -> np.ndarray:
     """
-    Find conversion errors for a list of test values.
+    Convert an array of float values to Float_4E3M 8-bit patterns in one pass.
+    
+    Matches Float_4E3M.from_value: out-of-range values (including infinities)
+    saturate to the largest magnitude, and exact ties resolve to the lower
+    bit pattern.
     
     Args:
-        test_values (list): List of values to test
+        values (list or np.ndarray): Values to convert
+        
+    Returns:
+        np.ndarray: uint8 array of bit patterns with the same shape as values
+    """
+    return Float_4E3M.from_value_array(values)
+
+
+def bits_to_values(bits) -> np.ndarray:
+    """
+    Convert an array of 8-bit patterns to their Float_4E3M values.
+    
+    Args:
+        bits (list or np.ndarray): Bit patterns (0-255)
+        
+    Returns:
+        np.ndarray: float64 array of values with the same shape as bits
+    """
+    bits = np.asarray(bits)
+    if bits.size and (bits.min() < 0 or bits.max() > 255):
+        raise ValueError("Bits must be between 0 and 255 (8 bits)")
+    
+    return _VALUE_ARRAY[bits.astype(np.uint8)]
+
+
+def find_conversion_errors(test_values) -> list:
+    """
+    Find conversion errors for a list or array of test values.
+    
+    Args:
+        test_values (list or np.ndarray): Values to test
         
     Returns:
         list: List of tuples (original_value, converted_value, error)
     """
-    errors = []
+    # Convert and measure the whole batch at once, then pair up the results
+    values = np.asarray(test_values, dtype=np.float64)
+    converted = bits_to_values(values_to_bits(values))
+    errors = np.abs(values - converted)
     
-    for value in test_values:
-        float_4e3m = Float_4E3M.from_value(value)
-        converted_value = float_4e3m.value
-        error = abs(value - converted_value)
-        errors.append((value, converted_value, error))
+    return list(zip(values.tolist(), converted.tolist(), errors.tolist()))
+
+
+def test_special_cases():
+    """Test special case handling for infinity, zero, and NaN."""
+    print("\n4. SPECIAL CASES TESTING")
+    print("-" * 50)
+    
+    # Test positive infinity
+    try:
+        pos_inf = Float_4E3M.from_value(float('inf'))
+        print(f"Positive infinity -> Sign: {pos_inf.sign}, Exp: {pos_inf.exponent}, Mant: {pos_inf.mantissa}")
+        print(f"  Bitstream: {pos_inf.to_bitstring()}, Value: {pos_inf.value}")
+    except Exception as e:
+        print(f"Positive infinity error: {e}")
+    
+    # Test negative infinity
+    try:
+        neg_inf = Float_4E3M.from_value(float('-inf'))
+        print(f"Negative infinity -> Sign: {neg_inf.sign}, Exp: {neg_inf.exponent}, Mant: {neg_inf.mantissa}")
+        print(f"  Bitstream: {neg_inf.to_bitstring()}, Value: {neg_inf.value}")
+    except Exception as e:
+        print(f"Negative infinity error: {e}")
+    
+    # Test zero
+    try:
+        zero = Float_4E3M.from_value(0.0)
+        print(f"Zero -> Sign: {zero.sign}, Exp: {zero.exponent}, Mant: {zero.mantissa}")
+        print(f"  Bitstream: {zero.to_bitstring()}, Value: {zero.value}")
+    except Exception as e:
+        print(f"Zero error: {e}")
+    
+    # Test NaN (should raise error)
+    try:
+        nan_result = Float_4E3M.from_value(float('nan'))
+        print(f"NaN -> Sign: {nan_result.sign}, Exp: {nan_result.exponent}, Mant: {nan_result.mantissa}")
+    except ValueError as e:
+        print(f"NaN correctly raised error: {e}")
+    except Exception as e:
+        print(f"NaN unexpected error: {e}")
+
+
+def benchmark_conversion_performance():
+    """Benchmark the numpy-optimized conversion performance."""
+    print("\n3. PERFORMANCE BENCHMARK")
+    print("-" * 50)
+    
+    # Test values for conversion
+    np.random.seed(42)  # For reproducible results
+    test_values = np.random.uniform(-2.0, 2.0, 1000)
+    
+    print("Testing conversion performance with 1000 random values...")
+    
+    # Warm up the vectorized conversion path
+    Float_4E3M.from_value_array([0.5])
+    
+    # Time the conversions (one batched call, no Float_4E3M objects)
+    start_time = time.time()
+    converted_bits = Float_4E3M.from_value_array(test_values)
+    end_time = time.time()
+    
+    conversion_time = end_time - start_time
+    print(f"✓ Converted 1000 values in {conversion_time:.4f} seconds")
+    print(f"✓ Average time per conversion: {conversion_time/1000*1000:.3f} ms")
+    
+    # Verify accuracy with a few examples (errors computed for all values at once)
+    converted_values = bits_to_values(converted_bits)
+    errors = np.abs(test_values - converted_values)
+    print("\nAccuracy verification (first 5 conversions):")
+    for i in range(5):
+        print(f"  {test_values[i]:8.4f} -> {converted_values[i]:8.4f} (error: {errors[i]:.6f})")
     
-    return errors
+    return converted_bits
 
 
 if __name__ == "__main__":
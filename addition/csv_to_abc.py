@@ -3,19 +3,38 @@ Convert Float_4E3M CSV results to ABC logic synthesis format.
 This script focuses on hierarchical synthesis optimizing all 8 output functions simultaneously.
 """
 
+import argparse
 import csv
+import hashlib
+import mmap
+import multiprocessing
 import subprocess
 import os
-from typing import List, Tuple, Dict
+import re
+import shutil
+import numpy as np
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional, Tuple, Dict
 
 
-def csv_to_abc_hierarchical_synthesis(csv_filename: str, output_dir: str = "abc_output") -> None:
+def csv_to_abc_hierarchical_synthesis(csv_filename: str, output_dir: str = "abc_output",
+                                      write_separate: bool = False,
+                                      delay_ps: Optional[float] = None,
+                                      fast: bool = False,
+                                      write_verilog: bool = False) -> None:
     """
     Convert CSV file to ABC format and perform hierarchical synthesis for all 8 outputs together.
     
     Args:
         csv_filename (str): Input CSV file with operand1, operand2, result columns
         output_dir (str): Directory to store ABC files and results
+        write_separate (bool): Also write the 8 per-bit truth tables for
+            reference/analysis (not used by synthesis)
+        delay_ps (float): Delay target for Yosys' ABC pass, in picoseconds
+        fast (bool): Use Yosys' faster, lower-effort ABC pass
+        write_verilog (bool): Also write the ROM-style behavioral Verilog
+            (and its $readmemb file) to the results directory, for simulation
     """
     
     # Convert to absolute paths
@@ -26,231 +45,617 @@ def csv_to_abc_hierarchical_synthesis(csv_filename: str, output_dir: str = "abc_
     print(f"Output directory: {abs_output_dir}")
     
     # Create organized directory structure
-    separate_dir = os.path.join(abs_output_dir, "separate_TT")
+    separate_dir = os.path.join(abs_output_dir, "separate_TT") if write_separate else None
     combined_dir = os.path.join(abs_output_dir, "combined_TT")
     results_dir = os.path.join(abs_output_dir, "synthesis_results")
     
-    os.makedirs(separate_dir, exist_ok=True)
-    os.makedirs(combined_dir, exist_ok=True)
-    os.makedirs(results_dir, exist_ok=True)
+    # Walk up the tree once for the base; the leaves then need a single mkdir each
+    Path(abs_output_dir).mkdir(parents=True, exist_ok=True)
+    for leaf_dir in (separate_dir, combined_dir, results_dir):
+        if leaf_dir is not None:
+            Path(leaf_dir).mkdir(exist_ok=True)
     
     print(f"✓ Created directories:")
-    print(f"  - Separate TT: {separate_dir}")
+    if separate_dir is not None:
+        print(f"  - Separate TT: {separate_dir}")
     print(f"  - Combined TT: {combined_dir}")
     print(f"  - Results: {results_dir}")
     
-    # Read CSV data
-    truth_table_data = []
+    # Parse the CSV and write the combined (and optional separate) truth tables
+    combined_file, truth_table = csv_to_truth_tables(abs_csv_file, separate_dir, combined_dir)
     
-    print("Reading CSV file...")
-    try:
-        with open(abs_csv_file, 'r') as f:
-            reader = csv.DictReader(f)
-            for row_num, row in enumerate(reader):
-                try:
-                    op1_bits = row['operand1']
-                    op2_bits = row['operand2']
-                    result_bits = row['result']
-                    
-                    # Combine op1 and op2 as 16-bit input
-                    input_bits = op1_bits + op2_bits
-                    
-                    truth_table_data.append((input_bits, result_bits))
-                except KeyError as e:
-                    print(f"✗ CSV format error at row {row_num+1}: Missing column {e}")
-                    print(f"Available columns: {list(row.keys())}")
-                    return
-                except Exception as e:
-                    print(f"✗ Error processing row {row_num+1}: {e}")
-                    continue
-    
-    except Exception as e:
-        print(f"✗ Error reading CSV file: {e}")
+    if combined_file is None:
         return
     
-    print(f"✓ Processed {len(truth_table_data)} truth table entries")
+    print(f"✓ Processed {len(truth_table)} unique truth table entries")
     
-    if len(truth_table_data) == 0:
+    if len(truth_table) == 0:
         print("✗ No valid data found in CSV file")
         return
     
-    # Generate separate truth tables (for reference/analysis)
-    print("\nGenerating separate truth tables for analysis...")
-    for bit_pos in range(8):
-        generate_separate_truth_table(truth_table_data, bit_pos, separate_dir)
-    
-    # Generate combined truth table for hierarchical synthesis
-    print("\nGenerating combined truth table for hierarchical synthesis...")
-    combined_file = generate_combined_truth_table(truth_table_data, combined_dir)
+    if write_verilog:
+        convert_truth_table_to_verilog(truth_table, results_dir)
+    
+    # Skip synthesis when this exact input, tool and options already produced
+    # a netlist; the truth tables above are always regenerated
+    hash_file = os.path.join(results_dir, ".input_hash")
+    tool = _synthesis_tool()
+    input_hash = (f"{_csv_fingerprint(abs_csv_file)} tool={tool} "
+                  f"espresso={check_tool_availability('espresso')} "
+                  f"delay_ps={delay_ps} fast={fast}\n")
+    if _synthesis_cached(hash_file, input_hash, results_dir, tool):
+        print("✓ cache hit, skipping synthesis (input unchanged since the last run)")
+        return
     
     # Perform hierarchical synthesis on all 8 outputs simultaneously
     print("\nPerforming hierarchical synthesis...")
-    perform_hierarchical_synthesis(combined_file, results_dir)
+    if perform_hierarchical_synthesis(combined_file, results_dir, truth_table, delay_ps, fast):
+        with open(hash_file, 'w') as f:
+            f.write(input_hash)
 
 
-def generate_separate_truth_table(truth_table_data: List[Tuple[str, str]], 
-                                 bit_position: int, separate_dir: str) -> str:
+def _csv_fingerprint(csv_filename: str) -> str:
+    """SHA-256 hex digest of a file's contents, read in _HASH_CHUNK_SIZE blocks."""
+    digest = hashlib.sha256()
+    with open(csv_filename, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _synthesis_tool() -> Optional[str]:
+    """Name of the tool perform_hierarchical_synthesis will use, or None."""
+    for tool in ("abc", "yosys"):
+        if check_tool_availability(tool):
+            return tool
+    return None
+
+
+def _synthesis_cached(hash_file: str, input_hash: str, results_dir: str,
+                      tool: Optional[str]) -> bool:
     """
-    Generate separate truth table file for analysis (not for synthesis).
+    Check whether results_dir holds a netlist synthesized from the same input.
     
     Args:
-        truth_table_data: List of (input_bits, output_bits) tuples
-        bit_position: Which output bit (0-7)
-        separate_dir: Output directory for separate files
+        hash_file: Fingerprint recorded by the last successful synthesis
+        input_hash: Fingerprint of the current input, tool and options
+        results_dir: Directory for synthesis results
+        tool: Synthesis tool that would run ("abc", "yosys" or None)
         
     Returns:
-        str: Path to generated file
+        bool: True if the fingerprints match and that tool's optimized
+        netlist exists
+    """
+    if tool is None:
+        return False
+    try:
+        with open(hash_file) as f:
+            if f.read() != input_hash:
+                return False
+    except OSError:
+        return False
+    return os.path.exists(os.path.join(results_dir, _SYNTHESIS_OUTPUTS[tool]))
+
+
+# Block size for fingerprinting the input CSV
+_HASH_CHUNK_SIZE = 1 << 20
+
+# Optimized netlist written by each synthesis tool
+_SYNTHESIS_OUTPUTS = {"abc": "float_4e3m_adder_optimized.v",
+                      "yosys": "float_4e3m_adder_yosys_optimized.v"}
+
+# $readmemb file behind the ROM-style behavioral Verilog, next to the .v file
+_ROM_FILE_NAME = "float_4e3m_adder_rom.mem"
+
+# Behavioral Verilog module around the $readmemb ROM, written with one call
+_ROM_VERILOG = (b"// Float_4E3M Adder - Behavioral Verilog\n"
+                b"// Generated from truth table\n\n"
+                b"module float_4e3m_adder(\n"
+                b"    input [15:0] operands,  // {op1[7:0], op2[7:0]}\n"
+                b"    output [7:0] result\n"
+                b");\n\n"
+                b"reg [7:0] rom [0:65535];\n"
+                b"initial $readmemb(\"%s\", rom);\n\n"
+                b"assign result = rom[operands];\n\n"
+                b"endmodule\n") % _ROM_FILE_NAME.encode('ascii')
+
+# Size of a well-formed combined truth table row: "<16 inputs> <8 outputs>\n"
+_TT_ROW_SIZE = 26
+
+# CSV files at least this large are parsed in parallel worker processes
+_PARALLEL_CSV_MIN_BYTES = 10 * 1024 * 1024
+
+# Headers around the ABC script recorded at the top of abc_synthesis.log;
+# parse_abc_results skips everything up to the output header
+_ABC_LOG_SCRIPT_HEADER = b"ABC Synthesis Script\n" + b"=" * 30 + b"\n"
+_ABC_LOG_OUTPUT_TITLE = b"ABC Output\n"
+_ABC_LOG_OUTPUT_HEADER = _ABC_LOG_OUTPUT_TITLE + b"=" * 30 + b"\n"
+
+# Classifies an ABC log line in one search: group 1 is set when the line
+# opens a statistics section (i/o, nodes, levels anywhere in it); otherwise
+# a match means an "abc" line, which closes the current section
+_ABC_LINE_RE = re.compile(rb'(?i)\A(?=.*?(i/o|nodes|levels))|abc')
+
+
+def _write_truth_table(filename: str, num_outputs: int, with_labels: bool,
+                       row_count: int, body) -> None:
     """
+    Write an ABC truth table file: header, prebuilt body and end marker.
     
-    filename = os.path.join(separate_dir, f"output_bit_{bit_position}.tt")
+    Args:
+        filename: Output truth table path
+        num_outputs: Number of output bits (.o)
+        with_labels: Whether to write the .ilb/.ob name lines
+        row_count: Number of rows in body (.p)
+        body: Table rows as bytes or a uint8 array, one "<inputs> <outputs>\n" each
+    """
+    with open(filename, 'wb') as f:
+        f.write(b".i 16\n")  # 16 input bits (op1[7:0] + op2[7:0])
+        f.write(b".o %d\n" % num_outputs)
+        f.write(b".p %d\n" % row_count)
+        
+        if with_labels:
+            # Add input/output names for better readability
+            f.write(b".ilb op1_7 op1_6 op1_5 op1_4 op1_3 op1_2 op1_1 op1_0 "
+                    b"op2_7 op2_6 op2_5 op2_4 op2_3 op2_2 op2_1 op2_0\n")
+            f.write(b".ob result_7 result_6 result_5 result_4 result_3 result_2 result_1 result_0\n")
+        
+        f.write(body)
+        f.write(b".e\n")
+
+
+def _record_truth_table_row(truth_table: Dict[bytes, bytes], input_bits: bytes,
+                            result_bits: bytes) -> bool:
+    """
+    Add a row to the truth table unless its input pattern was already seen
+    (the first occurrence wins; a conflicting result triggers a warning).
     
-    with open(filename, 'w') as f:
-        # ABC truth table header
-        f.write(".i 16\n")  # 16 input bits
-        f.write(".o 1\n")   # 1 output bit
-        f.write(f".p {len(truth_table_data)}\n")  # Number of product terms
+    Returns:
+        bool: True if the row was new and recorded
+    """
+    previous = truth_table.get(input_bits)
+    if previous is None:
+        truth_table[input_bits] = result_bits
+        return True
+    
+    if previous != result_bits:
+        print(f"Warning: Conflicting result for input {input_bits.decode()}; "
+              f"keeping {previous.decode()}")
+    return False
+
+
+def _collect_unique_csv_rows(reader, columns: Tuple[int, int, int],
+                             truth_table: Dict[bytes, bytes]) -> None:
+    """
+    Record every CSV row with a new operand pair in truth_table, as
+    (input_bits, result_bits).
+    
+    Args:
+        reader: csv.reader positioned after the header
+        columns: (operand1, operand2, result) column indices
+        truth_table: Mapping updated in place with the unique rows
+    """
+    op1_idx, op2_idx, result_idx = columns
+    for row in reader:
+        # csv.reader yields [] for blank lines, which DictReader skipped
+        if not row:
+            continue
         
-        # Write truth table entries
-        for input_bits, output_bits in truth_table_data:
-            output_bit = output_bits[bit_position]
-            f.write(f"{input_bits} {output_bit}\n")
+        try:
+            # Combine op1 and op2 as 16-bit input
+            input_bits = (row[op1_idx] + row[op2_idx]).encode('ascii')
+            result_bits = row[result_idx].encode('ascii')
+        except (IndexError, UnicodeEncodeError) as e:
+            print(f"✗ Error processing row {row}: {e}")
+            continue
         
-        f.write(".e\n")
+        _record_truth_table_row(truth_table, input_bits, result_bits)
+
+
+def _parse_csv_chunk(args: Tuple[str, int, int, Tuple[int, int, int]]) -> Dict[bytes, bytes]:
+    """Worker for _parse_csv_parallel: parse one newline-aligned byte range."""
+    csv_filename, start, end, columns = args
     
-    print(f"  Generated separate truth table for bit {bit_position}")
-    return filename
+    with open(csv_filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        lines = mm[start:end].decode('ascii').splitlines()
+    
+    truth_table = {}
+    _collect_unique_csv_rows(csv.reader(lines), columns, truth_table)
+    return truth_table
 
 
-def generate_combined_truth_table(truth_table_data: List[Tuple[str, str]], 
-                                 combined_dir: str) -> str:
+def _parse_csv_parallel(csv_filename: str, columns: Tuple[int, int, int]) -> Dict[bytes, bytes]:
     """
-    Generate combined truth table file for hierarchical synthesis.
+    Parse a large CSV across worker processes, one newline-aligned byte range
+    per CPU, and merge the per-chunk tables in file order.
     
     Args:
-        truth_table_data: List of (input_bits, output_bits) tuples
-        combined_dir: Output directory for combined file
+        csv_filename: Input CSV file (header on the first line)
+        columns: (operand1, operand2, result) column indices
         
     Returns:
-        str: Path to generated combined truth table file
+        Dict[bytes, bytes]: Mapping of 16-bit input pattern to 8-bit result
     """
+    workers = os.cpu_count() or 1
     
-    filename = os.path.join(combined_dir, "float_4e3m_adder.tt")
-    
-    with open(filename, 'w') as f:
-        # ABC truth table header
-        f.write(".i 16\n")  # 16 input bits (op1[7:0] + op2[7:0])
-        f.write(".o 8\n")   # 8 output bits
-        f.write(f".p {len(truth_table_data)}\n")  # Number of product terms
+    with open(csv_filename, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        size = len(mm)
+        data_start = mm.find(b"\n") + 1  # skip the header line
+        step = max(1, (size - data_start) // workers)
         
-        # Add input/output names for better readability
-        f.write(".ilb op1_7 op1_6 op1_5 op1_4 op1_3 op1_2 op1_1 op1_0 ")
-        f.write("op2_7 op2_6 op2_5 op2_4 op2_3 op2_2 op2_1 op2_0\n")
-        f.write(".ob result_7 result_6 result_5 result_4 result_3 result_2 result_1 result_0\n")
+        bounds = [data_start]
+        for i in range(1, workers):
+            newline = mm.find(b"\n", data_start + i * step)
+            if newline == -1:
+                break
+            if newline + 1 > bounds[-1]:
+                bounds.append(newline + 1)
+        bounds.append(size)
+    
+    chunks = [(csv_filename, start, end, columns)
+              for start, end in zip(bounds, bounds[1:]) if end > start]
+    print(f"  Parsing {size} bytes in {len(chunks)} parallel chunks...")
+    
+    with multiprocessing.Pool(min(workers, len(chunks))) as pool:
+        parts = pool.map(_parse_csv_chunk, chunks)
+    
+    truth_table = {}
+    for part in parts:
+        for input_bits, result_bits in part.items():
+            _record_truth_table_row(truth_table, input_bits, result_bits)
+    return truth_table
+
+
+def _uniform_truth_table_rows(body: bytes, row_count: int) -> Optional[np.ndarray]:
+    """
+    View a combined truth table body as a (rows, _TT_ROW_SIZE) byte matrix.
+    
+    Returns:
+        np.ndarray: The row matrix, or None if any row is not exactly 16 input
+        characters, a space, 8 output characters and a newline
+    """
+    if len(body) != row_count * _TT_ROW_SIZE:
+        return None
+    
+    lines = np.frombuffer(body, dtype=np.uint8).reshape(row_count, _TT_ROW_SIZE)
+    bit_columns = np.concatenate((lines[:, :16], lines[:, 17:25]), axis=1)
+    if ((lines[:, 16] != 0x20).any() or (lines[:, 25] != 0x0A).any()
+            or np.isin(bit_columns, (0x20, 0x0A)).any()):
+        return None
+    return lines
+
+
+def _write_separate_tables(separate_filenames: List[str], rows: list,
+                           combined_body: bytes) -> None:
+    """
+    Write the per-bit truth tables: "<inputs> <bit i>\n" per row in file i.
+    
+    Well-formed tables are sliced out of the combined body as byte columns
+    with NumPy, one write per file; anything else falls back to formatting
+    each row in Python, where rows with a result too short to have bit i are
+    left out of file i (and out of its .p count).
+    
+    Args:
+        separate_filenames: Per-bit truth table paths, one per result character
+        rows: The (input_bits, result_bits) pairs written to the combined table
+        combined_body: The combined table body built from rows
+    """
+    lines = _uniform_truth_table_rows(combined_body, len(rows))
+    
+    if lines is None:
+        for bit_pos, filename in enumerate(separate_filenames):
+            bit_rows = [b"%s %s\n" % (input_bits, result_bits[bit_pos:bit_pos + 1])
+                        for input_bits, result_bits in rows if len(result_bits) > bit_pos]
+            _write_truth_table(filename, 1, False, len(bit_rows), b"".join(bit_rows))
+        return
+    
+    # Inputs and the separator are shared by every per-bit row; only the
+    # output column changes from file to file
+    bit_lines = np.empty((len(rows), 19), dtype=np.uint8)
+    bit_lines[:, :17] = lines[:, :17]
+    bit_lines[:, 18] = 0x0A
+    for bit_pos, filename in enumerate(separate_filenames):
+        bit_lines[:, 17] = lines[:, 17 + bit_pos]
+        _write_truth_table(filename, 1, False, len(rows), bit_lines)
+
+
+def _write_truth_tables(rows, combined_filename: str, separate_filenames: List[str]) -> int:
+    """
+    Write (input_bits, result_bits) rows to the combined truth table and the
+    per-bit truth tables.
+    
+    Args:
+        rows: Iterable of (16-bit input, 8-bit result) bytes pairs
+        combined_filename: Combined 16-input / 8-output truth table path
+        separate_filenames: Per-bit truth table paths (may be empty)
         
-        # Write truth table entries
-        for input_bits, output_bits in truth_table_data:
-            f.write(f"{input_bits} {output_bits}\n")
+    Returns:
+        int: Number of rows written
+    """
+    rows = list(rows)
+    
+    # Rows are unique operand pairs, so the combined body is bounded at
+    # 65 536 fixed 26-byte rows (~1.7 MB); it is built whole as ASCII bytes
+    # (no text codec) and written with one call
+    combined_body = b"".join([b"%s %s\n" % (input_bits, result_bits)
+                              for input_bits, result_bits in rows])
+    _write_truth_table(combined_filename, 8, True, len(rows), combined_body)
+    
+    if separate_filenames:
+        _write_separate_tables(separate_filenames, rows, combined_body)
+    
+    return len(rows)
+
+
+def csv_to_truth_tables(csv_filename: str, separate_dir: Optional[str],
+                        combined_dir: str) -> Tuple[str, Dict[bytes, bytes]]:
+    """
+    Parse CSV rows into an in-memory truth table, sort it by input pattern,
+    then write the combined truth table and, optionally, the 8 separate
+    per-bit truth tables from it.
+    
+    Repeated operand pairs are kept only once (the first occurrence wins),
+    so the tables never exceed 65 536 rows however long the CSV is, and rows
+    are written in ascending input order whatever the CSV order. CSV files
+    of 10 MB or more are parsed in parallel worker processes.
+    
+    Args:
+        csv_filename: Input CSV file with operand1, operand2, result columns
+        separate_dir: Output directory for the per-bit files (reference/analysis),
+            or None to skip them
+        combined_dir: Output directory for the combined file (synthesis input)
         
-        f.write(".e\n")
+    Returns:
+        Tuple[str, Dict[bytes, bytes]]: (path to combined truth table,
+        mapping of 16-bit input pattern to 8-bit result), or (None, {}) if the
+        CSV could not be read
+    """
+    combined_filename = os.path.join(combined_dir, "float_4e3m_adder.tt")
+    separate_filenames = []
+    if separate_dir is not None:
+        separate_filenames = [os.path.join(separate_dir, f"output_bit_{bit_pos}.tt")
+                              for bit_pos in range(8)]
     
-    print(f"  Generated combined truth table: {filename}")
-    return filename
+    print("Reading CSV file...")
+    try:
+        with open(csv_filename, 'r') as csv_file:
+            reader = csv.reader(csv_file)
+            header = next(reader, [])
+            
+            # Resolve column positions once instead of per-row dict lookups
+            missing = [col for col in ('operand1', 'operand2', 'result') if col not in header]
+            if missing:
+                print(f"✗ CSV format error: Missing column(s) {missing}")
+                print(f"Available columns: {header}")
+                return None, {}
+            columns = (header.index('operand1'), header.index('operand2'), header.index('result'))
+            
+            if os.path.getsize(csv_filename) >= _PARALLEL_CSV_MIN_BYTES:
+                truth_table = _parse_csv_parallel(csv_filename, columns)
+            else:
+                truth_table = {}
+                _collect_unique_csv_rows(reader, columns, truth_table)
+            
+            # Canonical row order: ascending input pattern (equal-width bit
+            # strings sort numerically); a near no-op on generated CSVs,
+            # which are already in operand order
+            truth_table = dict(sorted(truth_table.items()))
+            _write_truth_tables(truth_table.items(), combined_filename, separate_filenames)
+    
+    except Exception as e:
+        print(f"✗ Error reading CSV file: {e}")
+        return None, {}
+    
+    print(f"  Generated combined truth table: {combined_filename}")
+    if separate_dir is not None:
+        print(f"  Generated separate truth tables for bits 0-7 in: {separate_dir}")
+    return combined_filename, truth_table
 
 
-def perform_hierarchical_synthesis(truth_table_file: str, results_dir: str) -> None:
+def perform_hierarchical_synthesis(truth_table_file: str, results_dir: str,
+                                   truth_table: Dict[bytes, bytes],
+                                   delay_ps: Optional[float] = None,
+                                   fast: bool = False) -> bool:
     """
     Perform hierarchical synthesis using ABC or Yosys (whichever is available).
     
     Args:
-        truth_table_file: Input combined truth table file
+        truth_table_file: Input combined truth table file (read by ABC)
         results_dir: Directory for synthesis results
+        truth_table: In-memory input->result mapping (used to build Yosys input)
+        delay_ps: Delay target for Yosys' ABC pass, in picoseconds
+        fast: Use Yosys' faster, lower-effort ABC pass
+        
+    Returns:
+        bool: True if a synthesis tool ran successfully
     """
     
     # Check which synthesis tool is available
     abc_available = check_tool_availability("abc")
     yosys_available = check_tool_availability("yosys")
     
+    # Start either tool from a two-level minimized cover when Espresso is installed
+    pla_file = None
+    if abc_available or yosys_available:
+        pla_file = minimize_truth_table(truth_table_file, results_dir)
+    
     if abc_available:
         print("Using ABC for hierarchical synthesis...")
-        perform_abc_synthesis(truth_table_file, results_dir)
+        return perform_abc_synthesis(truth_table_file, results_dir, pla_file)
     elif yosys_available:
         print("Using Yosys for hierarchical synthesis...")
-        perform_yosys_synthesis(truth_table_file, results_dir)
-    else:
-        print("✗ Neither ABC nor Yosys found!")
-        print_installation_instructions()
+        if pla_file is not None:
+            truth_table = read_pla_cubes(pla_file)
+        return perform_yosys_synthesis(truth_table, results_dir, delay_ps, fast)
+    
+    print("✗ Neither ABC nor Yosys found!")
+    print_installation_instructions()
+    return False
 
 
+@lru_cache(maxsize=None)
 def check_tool_availability(tool_name: str) -> bool:
-    """Check if a synthesis tool is available."""
-    try:
-        result = subprocess.run([tool_name, "-h"], capture_output=True, text=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    """Check if a synthesis tool is available on PATH (cached per tool name)."""
+    return shutil.which(tool_name) is not None
+
+
+def minimize_truth_table(truth_table_file: str, results_dir: str) -> Optional[str]:
+    """
+    Two-level minimize the combined truth table with Espresso, if installed.
+    
+    Espresso merges the one-row-per-operand-pair on-sets of all 8 outputs
+    into shared product terms with don't-care ('-') inputs, which gives the
+    synthesis tools a far smaller starting cover.
+    
+    Args:
+        truth_table_file: Combined truth table (PLA format)
+        results_dir: Directory for the minimized PLA
+        
+    Returns:
+        str: Path to the minimized PLA, or None if Espresso is unavailable or fails
+    """
+    if not check_tool_availability("espresso"):
+        return None
+    
+    pla_file = os.path.join(results_dir, "float_4e3m_adder_minimized.pla")
+    print("Minimizing truth table with Espresso...")
+    with open(pla_file, 'wb') as out:
+        result = subprocess.run(["espresso", truth_table_file], stdout=out,
+                                stderr=subprocess.DEVNULL)
+    
+    if result.returncode != 0:
+        print(f"✗ Espresso failed with return code {result.returncode}; using the full truth table")
+        return None
+    
+    print(f"✓ Minimized truth table: {pla_file}")
+    return pla_file
 
 
-def perform_abc_synthesis(truth_table_file: str, results_dir: str) -> None:
-    """Perform ABC synthesis (original method)."""
+def read_pla_cubes(pla_file: str) -> Dict[bytes, bytes]:
+    """
+    Read the product terms of a PLA file.
+    
+    Args:
+        pla_file: PLA written by Espresso
+        
+    Returns:
+        Dict[bytes, bytes]: Mapping of 16-character input cube to its 8 output
+        characters ('1' where the cube belongs to that output's on-set), in the
+        same form as the truth table from csv_to_truth_tables
+    """
+    cubes = {}
+    with open(pla_file, 'rb') as f:
+        for line in f:
+            fields = line.split()
+            if len(fields) != 2 or fields[0][:1] in (b".", b"#"):
+                continue
+            
+            input_cube, output_bits = fields
+            previous = cubes.get(input_cube)
+            if previous is not None:
+                # The same cube listed twice covers the union of its outputs
+                output_bits = bytes(0x31 if 0x31 in (a, b) else a
+                                    for a, b in zip(previous, output_bits))
+            cubes[input_cube] = output_bits
+    
+    return cubes
+
+
+def perform_abc_synthesis(truth_table_file: str, results_dir: str,
+                          pla_file: Optional[str] = None) -> bool:
+    """
+    Perform ABC synthesis (original method).
+    
+    Args:
+        truth_table_file: Combined truth table file (PLA format)
+        results_dir: Directory for synthesis results
+        pla_file: Espresso-minimized PLA to start from instead, if available
+        
+    Returns:
+        bool: True if ABC completed successfully
+    """
+    
+    # The combined truth table is itself a PLA (.i/.o/.p, one cube per row),
+    # so ABC reads it, or its Espresso-minimized cover, with read_pla
+    read_command = f"read_pla {pla_file if pla_file is not None else truth_table_file}"
     
     # Advanced ABC command sequence for hierarchical synthesis
     abc_commands = [
-        f"read_truth {truth_table_file}",
+        read_command,
         "strash", "print_stats",
-        "balance", "rewrite -l", "balance", "refactor -l", "balance",
-        "rewrite -l", "balance", "compress2rs", "balance",
-        "choice", "balance", "fraig", "balance", "print_stats",
-        "map -a", "print_stats",
+        "&get -n", "&fraig -x", "&put",
+        "compress2rs", "compress2rs", "print_stats",
+        "if -K 6", "mfs3 -aemvz -I 4 -O 2", "strash", "print_stats",
+        "&get -n", "&nf -R 1000", "&put", "print_stats",
         f"write_verilog {results_dir}/float_4e3m_adder_optimized.v",
         f"write_blif {results_dir}/float_4e3m_adder_optimized.blif",
         "print_level", "print_io"
     ]
     
-    script_file = os.path.join(results_dir, "hierarchical_synthesis.abc")
-    with open(script_file, 'w') as f:
-        for cmd in abc_commands:
-            f.write(cmd + "\n")
-        f.write("quit\n")
-    
-    result = subprocess.run(["abc", "-f", script_file], capture_output=True, text=True, cwd=results_dir)
+    # Feed the script to ABC on stdin instead of through a script file
+    abc_script = "".join(cmd + "\n" for cmd in abc_commands) + "quit\n"
+    print(f"ABC script:\n{abc_script}")
+    
+    # Record the script at the top of the log, then send ABC's output straight
+    # to the log file rather than holding it in memory
+    log_file = os.path.join(results_dir, "abc_synthesis.log")
+    with open(log_file, 'wb') as log:
+        log.write(_ABC_LOG_SCRIPT_HEADER)
+        log.write(abc_script.encode('ascii'))
+        log.write(b"\n" + _ABC_LOG_OUTPUT_HEADER)
+        log.flush()
+        result = subprocess.run(["abc"], input=abc_script.encode('ascii'), stdout=log,
+                                stderr=subprocess.STDOUT, cwd=results_dir)
     
     if result.returncode == 0:
         print("✓ ABC hierarchical synthesis completed!")
-        parse_abc_results(result.stdout, results_dir)
-    else:
-        print(f"✗ ABC synthesis failed: {result.stderr}")
+        parse_abc_results(log_file, results_dir)
+        return True
+    
+    print(f"✗ ABC synthesis failed with return code {result.returncode}; see {log_file}")
+    return False
 
 
-def perform_yosys_synthesis(truth_table_file: str, results_dir: str) -> None:
-    """Perform synthesis using Yosys as alternative to ABC."""
+def perform_yosys_synthesis(truth_table: Dict[bytes, bytes], results_dir: str,
+                            delay_ps: Optional[float] = None, fast: bool = False) -> bool:
+    """
+    Perform synthesis using Yosys as alternative to ABC.
+    
+    Args:
+        truth_table: Input->result mapping to synthesize
+        results_dir: Directory for synthesis results
+        delay_ps: Delay target for the ABC pass (abc -D), in picoseconds
+        fast: Run the ABC pass with -fast for quicker, lower-effort iterations
+        
+    Returns:
+        bool: True if Yosys completed successfully
+    """
     
     # Convert relative paths to absolute paths
-    abs_truth_table_file = os.path.abspath(truth_table_file)
     abs_results_dir = os.path.abspath(results_dir)
     
-    print(f"Truth table file: {abs_truth_table_file}")
     print(f"Results directory: {abs_results_dir}")
     
-    # First, convert truth table to Verilog behavioral code
-    verilog_file = convert_truth_table_to_verilog(abs_truth_table_file, abs_results_dir)
+    # First, convert truth table to a two-level BLIF netlist; this skips
+    # elaborating a behavioral case statement through proc/fsm/memory
+    input_blif = convert_truth_table_to_blif(truth_table, abs_results_dir)
     
-    # Use absolute paths for all files
-    abs_verilog_file = os.path.abspath(verilog_file)
+    # Every file lives under abs_results_dir, so these are absolute already
     output_verilog = os.path.join(abs_results_dir, "float_4e3m_adder_yosys_optimized.v")
     output_blif = os.path.join(abs_results_dir, "float_4e3m_adder_yosys_optimized.blif")
     
+    # ABC pass options; -D takes a whole number of picoseconds
+    abc_command = "abc"
+    if delay_ps is not None:
+        abc_command += f" -D {int(round(delay_ps))}"
+    if fast:
+        abc_command += " -fast"
+    
     # Yosys synthesis commands with absolute paths
-    yosys_script = f"""read_verilog {abs_verilog_file}
+    yosys_script = f"""read_blif {input_blif}
 hierarchy -check -top float_4e3m_adder
-proc
-opt
-fsm
-opt
-memory
-opt
-techmap
-opt
-abc
+synth -top float_4e3m_adder
+{abc_command}
 opt
 clean
 stat
@@ -268,7 +673,7 @@ write_blif {output_blif}
     # Verify script file exists
     if not os.path.exists(script_file):
         print(f"✗ Script file was not created: {script_file}")
-        return
+        return False
     
     print(f"✓ Script file created successfully")
     print(f"Script contents:\n{yosys_script}")
@@ -277,23 +682,17 @@ write_blif {output_blif}
         # Change to results directory and run yosys
         print(f"Running Yosys from directory: {abs_results_dir}")
         
-        result = subprocess.run(
-            ["yosys", "-s", "yosys_synthesis.ys"], 
-            capture_output=True, 
-            text=True, 
-            cwd=abs_results_dir
-        )
+        # Send Yosys' output straight to the log file rather than holding it in memory
+        log_file = os.path.join(abs_results_dir, "yosys_synthesis.log")
+        with open(log_file, 'w') as log:
+            log.write("Yosys Synthesis Log\n")
+            log.write("=" * 30 + "\n\n")
+            log.flush()
+            result = subprocess.run(["yosys", "-s", "yosys_synthesis.ys"], stdout=log,
+                                    stderr=subprocess.STDOUT, cwd=abs_results_dir)
         
         if result.returncode == 0:
             print("✓ Yosys synthesis completed!")
-            
-            # Save Yosys log
-            log_file = os.path.join(abs_results_dir, "yosys_synthesis.log")
-            with open(log_file, 'w') as f:
-                f.write("Yosys Synthesis Log\n")
-                f.write("=" * 30 + "\n\n")
-                f.write(result.stdout)
-            
             print(f"✓ Yosys log saved to: {log_file}")
             
             # Check if output files were created
@@ -301,83 +700,112 @@ write_blif {output_blif}
                 print(f"✓ Optimized Verilog created: {output_verilog}")
             if os.path.exists(output_blif):
                 print(f"✓ BLIF file created: {output_blif}")
-                
-        else:
-            print(f"✗ Yosys synthesis failed with return code: {result.returncode}")
-            print(f"STDOUT:\n{result.stdout}")
-            print(f"STDERR:\n{result.stderr}")
-            
-            # Save error log
-            error_log = os.path.join(abs_results_dir, "yosys_error.log")
-            with open(error_log, 'w') as f:
-                f.write("Yosys Error Log\n")
-                f.write("=" * 20 + "\n\n")
-                f.write(f"Return code: {result.returncode}\n")
-                f.write(f"STDOUT:\n{result.stdout}\n")
-                f.write(f"STDERR:\n{result.stderr}\n")
+            return True
+        
+        print(f"✗ Yosys synthesis failed with return code {result.returncode}; see {log_file}")
     
     except Exception as e:
         print(f"✗ Yosys execution failed: {e}")
         print(f"Current working directory: {os.getcwd()}")
         print(f"Script file exists: {os.path.exists(script_file)}")
         print(f"Script file path: {script_file}")
+    
+    return False
+
 
+def _truth_table_matrices(truth_table: Dict[bytes, bytes]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    View the well-formed truth table entries as uint8 character matrices.
+    
+    Entries whose input is not 16 characters or whose result is not 8 are
+    reported and dropped; the common all-well-formed case is checked with
+    C-level length scans and needs no per-entry Python loop.
+    
+    Args:
+        truth_table: Mapping of 16-bit input pattern to 8-bit result
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: (N, 16) input and (N, 8) result
+        characters, in truth table order
+    """
+    inputs = list(truth_table)
+    outputs = list(truth_table.values())
+    
+    if set(map(len, inputs)) - {16} or set(map(len, outputs)) - {8}:
+        kept = []
+        for input_bits, output_bits in truth_table.items():
+            if len(input_bits) == 16 and len(output_bits) == 8:
+                kept.append((input_bits, output_bits))
+            else:
+                print(f"Warning: Skipping invalid entry: {input_bits.decode('ascii')} {output_bits.decode('ascii')}")
+        inputs = [input_bits for input_bits, _ in kept]
+        outputs = [output_bits for _, output_bits in kept]
+    
+    return (np.frombuffer(b"".join(inputs), dtype=np.uint8).reshape(-1, 16),
+            np.frombuffer(b"".join(outputs), dtype=np.uint8).reshape(-1, 8))
 
-def convert_truth_table_to_verilog(truth_table_file: str, results_dir: str) -> str:
-    """Convert truth table to behavioral Verilog for Yosys."""
+
+def convert_truth_table_to_verilog(truth_table: Dict[bytes, bytes], results_dir: str) -> str:
+    """
+    Convert the in-memory truth table to ROM-style behavioral Verilog.
+    
+    The results are written to a $readmemb memory file, one 8-bit line per
+    {op1, op2} address in numeric order, and the module reads the ROM at the
+    operand address. This keeps the Verilog a few lines long instead of a
+    case statement with one arm per truth table entry.
+    
+    Synthesis reads BLIF, so this is only reached through
+    csv_to_abc_hierarchical_synthesis(write_verilog=True) (--write-verilog).
+    
+    Args:
+        truth_table: Mapping of 16-bit input pattern to 8-bit result, as
+            returned by csv_to_truth_tables
+        results_dir: Directory for the generated Verilog and memory files
+        
+    Returns:
+        str: Path to the generated Verilog file
+    """
     
     verilog_file = os.path.join(results_dir, "float_4e3m_adder_behavioral.v")
+    rom_file = os.path.join(results_dir, _ROM_FILE_NAME)
     
     print(f"Converting truth table to Verilog...")
-    print(f"Input truth table: {truth_table_file}")
     print(f"Output Verilog: {verilog_file}")
     
-    # Read truth table
-    truth_table_entries = []
+    input_chars, output_chars = _truth_table_matrices(truth_table)
     
-    if not os.path.exists(truth_table_file):
-        print(f"✗ Truth table file not found: {truth_table_file}")
-        return verilog_file
+    # Decode every entry as a matrix of 0/1 digits; rows with other
+    # characters have no ROM address and are skipped too
+    input_digits = input_chars - ord("0")
+    binary = (input_digits <= 1).all(axis=1) & ((output_chars - ord("0")) <= 1).all(axis=1)
+    for row in np.flatnonzero(~binary).tolist():
+        print(f"Warning: Skipping invalid entry: {input_chars[row].tobytes().decode('ascii')} "
+              f"{output_chars[row].tobytes().decode('ascii')}")
     
-    with open(truth_table_file, 'r') as f:
-        lines = f.readlines()
-        
-        # Skip header lines and parse entries
-        for line_num, line in enumerate(lines):
-            line = line.strip()
-            if line and not line.startswith('.') and ' ' in line:
-                parts = line.split()
-                if len(parts) >= 2 and len(parts[0]) == 16 and len(parts[1]) == 8:
-                    truth_table_entries.append((parts[0], parts[1]))
-                elif len(parts) >= 2:
-                    print(f"Warning: Skipping line {line_num+1} - invalid format: {line}")
-    
-    print(f"✓ Parsed {len(truth_table_entries)} truth table entries")
-    
-    if len(truth_table_entries) == 0:
+    print(f"✓ Using {int(binary.sum())} truth table entries")
+    
+    if not binary.any():
         print("✗ No valid truth table entries found!")
         return verilog_file
     
-    # Generate behavioral Verilog
-    with open(verilog_file, 'w') as f:
-        f.write("// Float_4E3M Adder - Behavioral Verilog\n")
-        f.write("// Generated from truth table\n\n")
-        f.write("module float_4e3m_adder(\n")
-        f.write("    input [15:0] operands,  // {op1[7:0], op2[7:0]}\n")
-        f.write("    output reg [7:0] result\n")
-        f.write(");\n\n")
-        f.write("always @(*) begin\n")
-        f.write("    case (operands)\n")
-        
-        for input_bits, output_bits in truth_table_entries:
-            f.write(f"        16'b{input_bits}: result = 8'b{output_bits};\n")
-        
-        f.write("        default: result = 8'b00000000;\n")
-        f.write("    endcase\n")
-        f.write("end\n\n")
-        f.write("endmodule\n")
+    # One "<8 result bits>\n" line per address; addresses missing from the
+    # truth table read as 8'b00000000. Addresses are the 0/1 digit rows
+    # packed MSB-first into big-endian uint16s
+    addresses = np.packbits(input_digits[binary], axis=1).view('>u2').ravel()
+    rom = np.full((1 << 16, 9), ord("0"), dtype=np.uint8)
+    rom[:, 8] = ord("\n")
+    rom[addresses, :8] = output_chars[binary]
+    
+    with open(rom_file, 'wb') as f:
+        f.write(rom)
+    
+    # Generate behavioral Verilog; $readmemb resolves the memory file
+    # relative to the tool's working directory, which is results_dir
+    with open(verilog_file, 'wb') as f:
+        f.write(_ROM_VERILOG)
     
     print(f"✓ Generated behavioral Verilog: {verilog_file}")
+    print(f"✓ Generated ROM contents: {rom_file}")
     
     # Verify the file was created and has content
     if os.path.exists(verilog_file):
@@ -389,6 +817,72 @@ def convert_truth_table_to_verilog(truth_table_file: str, results_dir: str) -> s
     return verilog_file
 
 
+def convert_truth_table_to_blif(truth_table: Dict[bytes, bytes], results_dir: str) -> str:
+    """
+    Convert the in-memory truth table to a two-level BLIF netlist for Yosys.
+    
+    Each result bit becomes one .names block listing its on-set cubes, so
+    Yosys can read the logic directly instead of elaborating a 65K-arm case.
+    
+    Args:
+        truth_table: Mapping of 16-bit input pattern to 8-bit result, as
+            returned by csv_to_truth_tables
+        results_dir: Directory for the generated BLIF file
+        
+    Returns:
+        str: Path to the generated BLIF file
+    """
+    
+    blif_file = os.path.join(results_dir, "float_4e3m_adder_behavioral.blif")
+    
+    print(f"Converting truth table to BLIF...")
+    print(f"Output BLIF: {blif_file}")
+    
+    input_chars, output_chars = _truth_table_matrices(truth_table)
+    
+    print(f"✓ Using {len(input_chars)} truth table entries")
+    
+    if len(input_chars) == 0:
+        print("✗ No valid truth table entries found!")
+        return blif_file
+    
+    input_labels = b" ".join([b"op1_%d" % i for i in range(7, -1, -1)] +
+                             [b"op2_%d" % i for i in range(7, -1, -1)])
+    output_labels = [b"result_%d" % i for i in range(7, -1, -1)]
+    
+    with open(blif_file, 'wb') as f:
+        f.write(b"# Float_4E3M Adder - BLIF\n")
+        f.write(b"# Generated from truth table\n\n")
+        f.write(b".model float_4e3m_adder\n")
+        f.write(b".inputs %s\n" % input_labels)
+        f.write(b".outputs %s\n" % b" ".join(output_labels))
+        
+        # Every cube line is "<16 input bits> 1\n": build them all once as
+        # fixed-width byte records, then write each output's on-set with a
+        # single masked slice
+        cubes = np.empty((len(input_chars), 19), dtype=np.uint8)
+        cubes[:, :16] = input_chars
+        cubes[:, 16:] = np.frombuffer(b" 1\n", dtype=np.uint8)
+        
+        # One on-set cover per output; inputs absent from the table stay 0
+        for bit_index, output_label in enumerate(output_labels):
+            f.write(b"\n.names %s %s\n" % (input_labels, output_label))
+            f.write(cubes[output_chars[:, bit_index] == 0x31])
+        
+        f.write(b"\n.end\n")
+    
+    print(f"✓ Generated BLIF: {blif_file}")
+    
+    # Verify the file was created and has content
+    if os.path.exists(blif_file):
+        file_size = os.path.getsize(blif_file)
+        print(f"✓ BLIF file size: {file_size} bytes")
+    else:
+        print(f"✗ Failed to create BLIF file: {blif_file}")
+    
+    return blif_file
+
+
 def print_installation_instructions():
     """Print installation instructions for synthesis tools."""
     
@@ -411,37 +905,50 @@ def print_installation_instructions():
     print("   yosys -h")
 
 
-def parse_abc_results(abc_output: str, results_dir: str) -> None:
+def parse_abc_results(abc_log_file: str, results_dir: str) -> None:
     """
     Parse ABC output and generate human-readable optimization report.
     
     Args:
-        abc_output: ABC command output
+        abc_log_file: Path to the log holding ABC's command output
         results_dir: Directory to save the report
     """
     
     report_file = os.path.join(results_dir, "optimization_report.txt")
     
-    # Extract key statistics from ABC output
-    lines = abc_output.split('\n')
+    # Extract key statistics from ABC output, streaming the log line by line
     stats_sections = []
     current_section = []
     
-    for line in lines:
-        if 'i/o' in line.lower() or 'nodes' in line.lower() or 'levels' in line.lower():
-            if current_section:
-                stats_sections.append('\n'.join(current_section))
-                current_section = []
-            current_section.append(line)
-        elif current_section and (line.strip() == '' or 'abc' in line.lower()):
-            if current_section:
-                stats_sections.append('\n'.join(current_section))
-                current_section = []
-        elif current_section:
-            current_section.append(line)
+    with open(abc_log_file, 'rb') as log:
+        # Skip the recorded script so its command lines are not parsed as output
+        if log.read(len(_ABC_LOG_SCRIPT_HEADER)) == _ABC_LOG_SCRIPT_HEADER:
+            for line in log:
+                if line == _ABC_LOG_OUTPUT_TITLE:
+                    log.readline()  # the "=====" underline
+                    break
+        else:
+            log.seek(0)
+        
+        for line in log:
+            line = line.rstrip(b'\r\n')
+            match = _ABC_LINE_RE.search(line)
+            if match and match.group(1):
+                if current_section:
+                    stats_sections.append(b'\n'.join(current_section))
+                    current_section = []
+                current_section.append(line)
+            elif current_section and (match or line.strip() == b''):
+                if current_section:
+                    stats_sections.append(b'\n'.join(current_section))
+                    current_section = []
+            elif current_section:
+                current_section.append(line)
     
     if current_section:
-        stats_sections.append('\n'.join(current_section))
+        stats_sections.append(b'\n'.join(current_section))
+    
+    stats_sections = [section.decode('utf-8', errors='replace') for section in stats_sections]
     
     # Generate comprehensive report
     with open(report_file, 'w') as f:
@@ -458,11 +965,10 @@ def parse_abc_results(abc_output: str, results_dir: str) -> None:
         f.write("ABC OPTIMIZATION SEQUENCE:\n")
         f.write("-" * 30 + "\n")
         f.write("1. Truth table → AIG conversion\n")
-        f.write("2. Iterative balance + rewrite + refactor\n")
-        f.write("3. Compression with resynthesis\n")
-        f.write("4. Choice computation for mapping\n")
-        f.write("5. Functional reduction (FRAIG)\n")
-        f.write("6. Technology mapping\n\n")
+        f.write("2. Functional reduction (FRAIG)\n")
+        f.write("3. Two rounds of compression with resynthesis\n")
+        f.write("4. 6-input LUT mapping + don't-care resynthesis (mfs3)\n")
+        f.write("5. Area-oriented technology mapping (&nf)\n\n")
         
         f.write("SYNTHESIS STATISTICS:\n")
         f.write("-" * 25 + "\n")
@@ -490,6 +996,15 @@ def parse_abc_results(abc_output: str, results_dir: str) -> None:
 def main():
     """Main function for hierarchical synthesis."""
     
+    parser = argparse.ArgumentParser(description="Float_4E3M hierarchical circuit synthesis")
+    parser.add_argument("--delay-ps", type=float, default=None,
+                        help="delay target for Yosys' ABC pass, in picoseconds")
+    parser.add_argument("--fast", action="store_true",
+                        help="run Yosys' ABC pass with -fast for quicker iterations")
+    parser.add_argument("--write-verilog", action="store_true",
+                        help="also write the ROM-style behavioral Verilog for simulation")
+    args = parser.parse_args()
+    
     # Use the correct paths from your setup
     csv_file = "addition/demo_addition_results.csv"
     output_directory = "addition/hierarchical_synthesis"
@@ -522,7 +1037,9 @@ def main():
     print(f"✓ CSV file found: {abs_csv_file}")
     
     # Perform hierarchical synthesis
-    csv_to_abc_hierarchical_synthesis(abs_csv_file, abs_output_dir)
+    csv_to_abc_hierarchical_synthesis(abs_csv_file, abs_output_dir,
+                                      delay_ps=args.delay_ps, fast=args.fast,
+                                      write_verilog=args.write_verilog)
     
     print("\n" + "=" * 50)
     print("Hierarchical synthesis complete!")
@@ -11,7 +11,25 @@ Value calculation: (-1)^s * 2^(-exponent) * ((8+mantissa)/8)
 
 import math
 import numpy as np
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
+
+
+# Precomputed values for all 256 bit patterns, built once at import; sign,
+# exponent and mantissa are recovered from a pattern with shifts when needed
+_ALL_BITS = np.arange(256, dtype=np.uint8)
+
+# Per-field factors of the value formula, indexed by the sign / exponent field
+_SIGN_FACTORS = (1.0, -1.0)
+_POW2_NEG = tuple(2.0 ** -exponent for exponent in range(16))
+
+# value = (-1)^s * 2^(-exponent) * ((8+mantissa)/8), as table lookups and
+# multiplies only
+_ALL_VALUES = (np.array(_SIGN_FACTORS)[_ALL_BITS >> 7]
+               * np.array(_POW2_NEG)[(_ALL_BITS >> 3) & 0xF]
+               * (8 + (_ALL_BITS & 0x7).astype(np.float64)) * 0.125)
+
+# Range-check constructor arguments unless running with python -O
+_VALIDATE = __debug__
 
 
 class Float_4E3M:
@@ -21,12 +39,13 @@ class Float_4E3M:
     The value is calculated as: (-1)^s * 2^(-exponent) * ((8+mantissa)/8)
     where s is the sign bit, exponent is the 4-bit exponent value, 
     and mantissa is the 3-bit mantissa value.
+    
+    Instances are immutable: from_bits, from_value and addition hand out one
+    shared instance per bit pattern, so the fields cannot be reassigned.
     """
     
-    # Class variables to store precomputed values for efficient conversion
-    _all_values = None
-    _all_components = None
-    _initialized = False
+    # Instances only carry the three bit fields; no per-instance __dict__
+    __slots__ = ('sign', 'exponent', 'mantissa')
     
     def __init__(self, sign: int, exponent: int, mantissa: int):
         """
@@ -37,48 +56,32 @@ class Float_4E3M:
             exponent (int): 4-bit exponent value (0-15)
             mantissa (int): 3-bit mantissa value (0-7)
         """
-        # Validate input ranges
-        if not (0 <= sign <= 1):
-            raise ValueError("Sign bit must be 0 or 1")
-        if not (0 <= exponent <= 15):
-            raise ValueError("Exponent must be between 0 and 15 (4 bits)")
-        if not (0 <= mantissa <= 7):
-            raise ValueError("Mantissa must be between 0 and 7 (3 bits)")
-        
-        self.sign = sign
-        self.exponent = exponent
-        self.mantissa = mantissa
+        # Validate input ranges (skipped under python -O)
+        if _VALIDATE:
+            if not (0 <= sign <= 1):
+                raise ValueError("Sign bit must be 0 or 1")
+            if not (0 <= exponent <= 15):
+                raise ValueError("Exponent must be between 0 and 15 (4 bits)")
+            if not (0 <= mantissa <= 7):
+                raise ValueError("Mantissa must be between 0 and 7 (3 bits)")
         
-        # Initialize precomputed values if not already done
-        if not Float_4E3M._initialized:
-            Float_4E3M._initialize_lookup_tables()
+        # Set the read-only fields past __setattr__
+        object.__setattr__(self, 'sign', sign)
+        object.__setattr__(self, 'exponent', exponent)
+        object.__setattr__(self, 'mantissa', mantissa)
+    
+    def __setattr__(self, name, value):
+        """Reject assignment; instances are shared and must stay immutable."""
+        raise AttributeError(f"Float_4E3M is immutable; cannot set '{name}'")
+    
+    def __delattr__(self, name):
+        """Reject deletion; instances are shared and must stay immutable."""
+        raise AttributeError(f"Float_4E3M is immutable; cannot delete '{name}'")
+    
+    def __reduce__(self):
+        """Pickle/copy by bit pattern, restoring the shared canonical instance."""
+        return (Float_4E3M.from_bits, (self.to_bits(),))
     
-    @classmethod
-    def _initialize_lookup_tables(cls):
-        """
-        Initialize lookup tables with all possible Float_4E3M values for efficient conversion.
-        Uses numpy for vectorized computation.
-        """
-        if cls._initialized:
-            return
-        
-        # Create arrays for all possible bit patterns
-        all_bits = np.arange(256, dtype=np.uint8)
-        
-        # Extract sign, exponent, and mantissa for all bit patterns
-        signs = (all_bits >> 7) & 1
-        exponents = (all_bits >> 3) & 0xF
-        mantissas = all_bits & 0x7
-        
-        # Compute all values using vectorized operations
-        # value = (-1)^s * 2^(-exponent) * ((8+mantissa)/8)
-        sign_factors = np.where(signs == 0, 1.0, -1.0)
-        exponent_factors = 2.0 ** (-exponents.astype(np.float64))
-        mantissa_factors = (8 + mantissas.astype(np.float64)) / 8.0
-        
-        cls._all_values = sign_factors * exponent_factors * mantissa_factors
-        cls._all_components = np.column_stack((signs, exponents, mantissas))
-        cls._initialized = True
     @property
     def value(self) -> float:
         """
@@ -88,11 +91,8 @@ class Float_4E3M:
         Returns:
             float: The calculated floating-point value
         """
-        sign_factor = (-1) ** self.sign
-        exponent_factor = 2 ** (-self.exponent)
-        mantissa_factor = (8 + self.mantissa) / 8
-        
-        return sign_factor * exponent_factor * mantissa_factor
+        # Table lookups instead of pow(); multiplying by 0.125 is exact
+        return _SIGN_FACTORS[self.sign] * _POW2_NEG[self.exponent] * (8 + self.mantissa) * 0.125
     
     @classmethod
     def from_bits(cls, bits: int) -> 'Float_4E3M':
@@ -108,16 +108,24 @@ class Float_4E3M:
             bits (int): 8-bit integer (0-255)
             
         Returns:
-            Float_4E3M: New instance created from bit pattern
+            Float_4E3M: The shared canonical instance for the bit pattern;
+            every call for the same pattern returns the same object
         """
         if not (0 <= bits <= 255):
             raise ValueError("Bits must be between 0 and 255 (8 bits)")
         
-        sign = (bits >> 7) & 1
-        exponent = (bits >> 3) & 0xF  # Extract bits 6-3
-        mantissa = bits & 0x7         # Extract bits 2-0
+        # Only 256 values exist, so every pattern maps to one interned instance
+        return _CANON[bits]
+    
+    @classmethod
+    def all_instances(cls) -> List['Float_4E3M']:
+        """
+        Get the canonical instance of every bit pattern.
         
-        return cls(sign, exponent, mantissa)
+        Returns:
+            List[Float_4E3M]: All 256 instances, ordered by bit pattern (0-255)
+        """
+        return list(_CANON)
     
     def to_bits(self) -> int:
         """
@@ -137,46 +145,120 @@ class Float_4E3M:
         """
         return f"{self.to_bits():08b}"
     
-    @classmethod
-    def from_value(cls, value: float) -> 'Float_4E3M':
+    @staticmethod
+    def bits_from_value(value: float) -> int:
         """
-        Convert a regular float to Float_4E3M by finding the closest representation.
-        Uses precomputed numpy arrays for efficient minimum distance calculation.
+        Encode a float directly to the 8-bit pattern of its closest Float_4E3M.
+        
+        Reads the exponent and significand of the float (via math.frexp) and
+        rounds the top 3 fraction bits, instead of searching all 256 codes.
+        Out-of-range values (including infinities) saturate to the largest
+        magnitude, zero maps to (0, 15, 0), and exact ties resolve to the
+        lower bit pattern.
         
         Args:
             value (float): The value to convert
             
         Returns:
-            Float_4E3M: Closest Float_4E3M representation
+            int: 8-bit integer representation (0-255)
+        """
+        if math.isnan(value):
+            raise ValueError("Cannot convert NaN to Float_4E3M representation")
+        
+        if value == 0.0:
+            return 0b01111000  # (0, 15, 0) - smallest positive value
+        
+        sign = 0x80 if value < 0 else 0
+        magnitude = abs(value)
+        
+        # Saturate to the largest magnitude (covers infinities)
+        if magnitude >= 1.875:
+            return sign | 0x07
+        
+        # magnitude = significand * 2^(exp2), significand in [0.5, 1)
+        significand, exp2 = math.frexp(magnitude)
+        exponent = 1 - exp2
+        if exponent > 15:
+            # Below the smallest magnitude; when the distances to +/-2^-15 are
+            # equal in float64 the tie resolves to the positive pattern
+            if 2.0 ** -15 + magnitude == 2.0 ** -15 - magnitude:
+                return 0x78
+            return sign | 0x78
+        
+        # Round the 3 mantissa bits; ties go to the lower bit pattern, which is
+        # the smaller magnitude except when rounding across an exponent boundary
+        scaled = significand * 16.0 - 8.0
+        mantissa = int(scaled)
+        remainder = scaled - mantissa
+        if remainder > 0.5 or (remainder == 0.5 and mantissa == 7):
+            mantissa += 1
+        if mantissa == 8:
+            exponent -= 1
+            mantissa = 0
+        
+        return sign | (exponent << 3) | mantissa
+    
+    @staticmethod
+    def from_value_array(values) -> np.ndarray:
         """
-        # Ensure lookup tables are initialized
-        if not cls._initialized:
-            cls._initialize_lookup_tables()
+        Encode an array of floats to Float_4E3M 8-bit patterns in one pass.
         
-        # Handle special cases
-        if np.isnan(value):
+        Vectorized form of bits_from_value with identical rounding, saturation
+        and tie-breaking.
+        
+        Args:
+            values (list or np.ndarray): Values to convert
+            
+        Returns:
+            np.ndarray: uint8 array of bit patterns with the same shape as values
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if np.isnan(values).any():
             raise ValueError("Cannot convert NaN to Float_4E3M representation")
         
-        if np.isinf(value):
-            if value > 0:
-                # Positive infinity -> (0, 0, 7) - largest positive value
-                return cls(0, 0, 7)
-            else:
-                # Negative infinity -> (1, 0, 7) - largest negative value
-                return cls(1, 0, 7)
+        sign = np.where(values < 0, 0x80, 0)
+        magnitude = np.abs(values)
         
-        if value == 0.0:
-            # Zero -> (0, 15, 0) - smallest positive value with largest exponent
-            return cls(0, 15, 0)
+        # Infinities produce non-finite intermediates here; they are replaced
+        # by the saturation branch below
+        with np.errstate(invalid='ignore'):
+            significand, exp2 = np.frexp(magnitude)
+            exponent = 1 - exp2.astype(np.int64)
+            scaled = significand * 16.0 - 8.0
+            mantissa = np.floor(scaled)
+            remainder = scaled - mantissa
+            mantissa += (remainder > 0.5) | ((remainder == 0.5) & (mantissa == 7))
         
-        # Find the index with minimum absolute difference
-        differences = np.abs(cls._all_values - value)
-        best_index = np.argmin(differences)
+        underflow = exponent > 15
+        carry = mantissa == 8
+        exponent = exponent - carry
+        mantissa = np.where(carry | ~np.isfinite(mantissa), 0, mantissa).astype(np.int64)
+        bits = sign | (exponent << 3) | mantissa
         
-        # Extract the best components
-        sign, exponent, mantissa = cls._all_components[best_index]
+        # Below the smallest magnitude, with float64 ties going positive
+        tiny = 2.0 ** -15
+        underflow_bits = np.where(tiny + magnitude == tiny - magnitude, 0x78, sign | 0x78)
+        bits = np.where(underflow, underflow_bits, bits)
+        bits = np.where(magnitude >= 1.875, sign | 0x07, bits)
+        bits = np.where(values == 0.0, 0x78, bits)
         
-        return cls(int(sign), int(exponent), int(mantissa))
+        return bits.astype(np.uint8)
+    
+    @classmethod
+    def from_value(cls, value: float) -> 'Float_4E3M':
+        """
+        Convert a regular float to Float_4E3M by finding the closest representation.
+        Encodes the value's exponent and significand directly (see bits_from_value).
+        
+        Args:
+            value (float): The value to convert
+            
+        Returns:
+            Float_4E3M: Closest Float_4E3M representation
+        """
+        # bits_from_value rejects NaN, saturates infinities to the largest
+        # magnitude and maps zero to (0, 15, 0)
+        return _CANON[cls.bits_from_value(value)]
     
     def __str__(self) -> str:
         """String representation showing bit pattern and value."""
@@ -186,21 +268,37 @@ class Float_4E3M:
         """Detailed representation."""
         return f"Float_4E3M(sign={self.sign}, exp={self.exponent}, mant={self.mantissa}, value={self.value})"
     
+    @staticmethod
+    def add_bits(op1_bits, op2_bits):
+        """
+        Add Float_4E3M numbers given as 8-bit patterns using the addition table.
+        
+        Accepts ints or integer arrays (broadcast against each other like any
+        NumPy indexing), e.g. add_bits(a[:, None], b[None, :]) for a full table.
+        
+        Args:
+            op1_bits (int or np.ndarray): Bit patterns of the first operands
+            op2_bits (int or np.ndarray): Bit patterns of the second operands
+            
+        Returns:
+            np.uint8 or np.ndarray: Bit pattern(s) of the rounded sums
+        """
+        return _ADD_LUT[op1_bits, op2_bits]
+    
     def __add__(self, other: 'Float_4E3M') -> 'Float_4E3M':
         """
-        Add two Float_4E3M numbers by converting to float, adding, then converting back.
+        Add two Float_4E3M numbers with a single addition-table lookup.
         
         Args:
             other (Float_4E3M): The other number to add
             
         Returns:
-            Float_4E3M: Result of addition converted back to Float_4E3M
+            Float_4E3M: Result of addition rounded to Float_4E3M
         """
         if not isinstance(other, Float_4E3M):
             raise TypeError("Can only add Float_4E3M to Float_4E3M")
         
-        result_value = self.value + other.value
-        return Float_4E3M.from_value(result_value)
+        return _CANON[_ADD_LUT[self.to_bits(), other.to_bits()]]
     
     def __eq__(self, other) -> bool:
         """Check equality based on bit representation."""
@@ -212,3 +310,13 @@ class Float_4E3M:
         """Hash based on bit representation."""
         return hash(self.to_bits())
 
+
+# uint8[256, 256] table of op1 + op2 result bits, indexed by operand bits: the
+# exact sum of every pair of values rounded like Float_4E3M.from_value
+_ADD_LUT = Float_4E3M.from_value_array(_ALL_VALUES[:, None] + _ALL_VALUES[None, :])
+_ADD_LUT.flags.writeable = False
+assert _ADD_LUT.shape == (256, 256) and (_ADD_LUT == _ADD_LUT.T).all(), \
+    "Float_4E3M addition table must cover every operand pair and be commutative"
+
+# Canonical instance for every bit pattern, shared by from_bits and __add__
+_CANON = tuple(Float_4E3M((bits >> 7) & 1, (bits >> 3) & 0xF, bits & 0x7) for bits in range(256))
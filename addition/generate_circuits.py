@@ -4,14 +4,26 @@ Generates truth tables and prepares files for synthesis
 """
 
 import csv
+import mmap
 import subprocess
 import os
+import shutil
 import time
 import numpy as np
 from float_4e3m import Float_4E3M
 from generator import generate_all_float_4e3m, print_all_representations, analyze_value_distribution
-from conversion_utils import value_to_bitstream, value_to_components, demonstrate_conversion
-from operations import generate_addition_table, analyze_addition_results, create_operation_matrix, save_addition_results_to_files, save_operation_results_to_files
+from conversion_utils import value_to_bitstream, value_to_components, demonstrate_conversion, test_special_cases, benchmark_conversion_performance
+from operations import add_table, generate_addition_table_bits, analyze_addition_results, create_operation_matrix, save_addition_results_to_files, save_operation_results_to_files
+
+
+# ASCII codes of the 8-bit binary string for every bit pattern, as uint8[256, 8]
+# indexed by the pattern itself
+_BITSTRING_CODES = np.frombuffer(
+    b"".join(f"{bits:08b}".encode('ascii') for bits in range(256)), dtype=np.uint8
+).reshape(256, 8)
+
+# Bytes per truth table line: 16 input bits, a space, 8 output bits, a newline
+_TT_LINE_SIZE = 26
 
 
 def save_truth_table_to_tt_file(list1, list2, filename):
@@ -25,45 +37,44 @@ def save_truth_table_to_tt_file(list1, list2, filename):
     """
     print(f"Generating truth table file: {filename}")
     
-    with open(filename, 'w') as f:
-        # Write BLIF header
-        f.write(".i 16\n")  # 16 inputs (8 bits for each operand)
-        f.write(".o 8\n")   # 8 outputs (8 bits for result)
-        f.write(f".p {len(list1) * len(list2)}\n")  # Number of product terms
-        
+    # Write BLIF header
+    header = (
+        b".i 16\n"   # 16 inputs (8 bits for each operand)
+        b".o 8\n"    # 8 outputs (8 bits for result)
+        b".p %d\n"   # Number of product terms
         # Input labels (operand1 and operand2 bit labels)
-        f.write(".ilb op1_7 op1_6 op1_5 op1_4 op1_3 op1_2 op1_1 op1_0 "
-                "op2_7 op2_6 op2_5 op2_4 op2_3 op2_2 op2_1 op2_0\n")
-        
+        b".ilb op1_7 op1_6 op1_5 op1_4 op1_3 op1_2 op1_1 op1_0 "
+        b"op2_7 op2_6 op2_5 op2_4 op2_3 op2_2 op2_1 op2_0\n"
         # Output labels (result bit labels)
-        f.write(".ob result_7 result_6 result_5 result_4 result_3 result_2 result_1 result_0\n")
-        
-        # Generate all combinations and their results
-        for i, op1 in enumerate(list1):
-            for j, op2 in enumerate(list2):
-                # Perform addition
-                try:
-                    result = op1 + op2
-                    
-                    # Convert operands and result to 8-bit binary strings
-                    op1_bits = op1.to_bitstring()
-                    op2_bits = op2.to_bitstring()
-                    result_bits = result.to_bitstring()
-                    
-                    # Write the truth table entry
-                    # Format: input_bits output_bits
-                    input_bits = op1_bits + op2_bits
-                    f.write(f"{input_bits} {result_bits}\n")
-                    
-                except Exception as e:
-                    # Handle any errors in addition (e.g., overflow, special cases)
-                    print(f"Warning: Error in addition {op1.to_bitstring()} + {op2.to_bitstring()}: {e}")
-                    # Write a default result (all zeros or handle as needed)
-                    input_bits = op1.to_bitstring() + op2.to_bitstring()
-                    f.write(f"{input_bits} 00000000\n")
-        
-        # Write end marker
-        f.write(".e\n")
+        b".ob result_7 result_6 result_5 result_4 result_3 result_2 result_1 result_0\n"
+    ) % (len(list1) * len(list2))
+    footer = b".e\n"  # End marker
+    
+    # Look every sum up in the Float_4E3M addition table
+    op1_bits = np.array([op1.to_bits() for op1 in list1], dtype=np.uint8)
+    op2_bits = np.array([op2.to_bits() for op2 in list2], dtype=np.uint8)
+    result_bits = add_table(op1_bits, op2_bits)
+    
+    # Every "<op1><op2> <result>\n" line is exactly _TT_LINE_SIZE bytes, so the
+    # file size is known up front: map it and fill the lines in place
+    body_size = op1_bits.size * op2_bits.size * _TT_LINE_SIZE
+    file_size = len(header) + body_size + len(footer)
+    
+    with open(filename, 'w+b') as f:
+        f.truncate(file_size)
+        with mmap.mmap(f.fileno(), file_size) as mm:
+            mm[:len(header)] = header
+            
+            lines = np.frombuffer(mm, dtype=np.uint8, count=body_size, offset=len(header))
+            lines = lines.reshape(op1_bits.size, op2_bits.size, _TT_LINE_SIZE)
+            lines[:, :, 0:8] = _BITSTRING_CODES[op1_bits][:, None, :]
+            lines[:, :, 8:16] = _BITSTRING_CODES[op2_bits][None, :, :]
+            lines[:, :, 16] = ord(" ")
+            lines[:, :, 17:25] = _BITSTRING_CODES[result_bits]
+            lines[:, :, 25] = ord("\n")
+            del lines  # release the buffer export before the map closes
+            
+            mm[len(header) + body_size:] = footer
     
     print(f"✓ Truth table saved to {filename}")
     print(f"  Format: BLIF-style truth table")
@@ -92,79 +103,6 @@ def save_operation_results_to_files_with_tt(list1, list2, txt_filename, csv_file
     save_truth_table_to_tt_file(list1, list2, tt_filename)
 
 
-def test_special_cases():
-    """Test special case handling for infinity, zero, and NaN."""
-    print("\n4. SPECIAL CASES TESTING")
-    print("-" * 50)
-    
-    # Test positive infinity
-    try:
-        pos_inf = Float_4E3M.from_value(float('inf'))
-        print(f"Positive infinity -> Sign: {pos_inf.sign}, Exp: {pos_inf.exponent}, Mant: {pos_inf.mantissa}")
-        print(f"  Bitstream: {pos_inf.to_bitstring()}, Value: {pos_inf.value}")
-    except Exception as e:
-        print(f"Positive infinity error: {e}")
-    
-    # Test negative infinity
-    try:
-        neg_inf = Float_4E3M.from_value(float('-inf'))
-        print(f"Negative infinity -> Sign: {neg_inf.sign}, Exp: {neg_inf.exponent}, Mant: {neg_inf.mantissa}")
-        print(f"  Bitstream: {neg_inf.to_bitstring()}, Value: {neg_inf.value}")
-    except Exception as e:
-        print(f"Negative infinity error: {e}")
-    
-    # Test zero
-    try:
-        zero = Float_4E3M.from_value(0.0)
-        print(f"Zero -> Sign: {zero.sign}, Exp: {zero.exponent}, Mant: {zero.mantissa}")
-        print(f"  Bitstream: {zero.to_bitstring()}, Value: {zero.value}")
-    except Exception as e:
-        print(f"Zero error: {e}")
-    
-    # Test NaN (should raise error)
-    try:
-        nan_result = Float_4E3M.from_value(float('nan'))
-        print(f"NaN -> Sign: {nan_result.sign}, Exp: {nan_result.exponent}, Mant: {nan_result.mantissa}")
-    except ValueError as e:
-        print(f"NaN correctly raised error: {e}")
-    except Exception as e:
-        print(f"NaN unexpected error: {e}")
-
-
-def benchmark_conversion_performance():
-    """Benchmark the numpy-optimized conversion performance."""
-    print("\n3. PERFORMANCE BENCHMARK")
-    print("-" * 50)
-    
-    # Test values for conversion
-    np.random.seed(42)  # For reproducible results
-    test_values = np.random.uniform(-2.0, 2.0, 1000)
-    
-    print("Testing conversion performance with 1000 random values...")
-    
-    # Warm up the class (initialize lookup tables)
-    Float_4E3M.from_value(0.5)
-    
-    # Time the conversions
-    start_time = time.time()
-    converted_objects = [Float_4E3M.from_value(val) for val in test_values]
-    end_time = time.time()
-    
-    conversion_time = end_time - start_time
-    print(f"✓ Converted 1000 values in {conversion_time:.4f} seconds")
-    print(f"✓ Average time per conversion: {conversion_time/1000*1000:.3f} ms")
-    
-    # Verify accuracy with a few examples
-    print("\nAccuracy verification (first 5 conversions):")
-    for i in range(5):
-        original = test_values[i]
-        converted = converted_objects[i]
-        error = abs(original - converted.value)
-        print(f"  {original:8.4f} -> {converted.value:8.4f} (error: {error:.6f})")
-    
-    return converted_objects
-
-
 def generate_csv_files(all_floats, output_dir="addition/TT"):
     """Generate CSV files with addition results and truth tables."""
     
@@ -174,9 +112,10 @@ def generate_csv_files(all_floats, output_dir="addition/TT"):
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
-    # Create two identical lists as requested
-    list1 = all_floats.copy()
-    list2 = all_floats.copy()
+    # Both operand lists are the full set; the objects are never mutated,
+    # so they can share the same list
+    list1 = all_floats
+    list2 = all_floats
     
     print(f"Created list1 with {len(list1)} objects")
     print(f"Created list2 with {len(list2)} objects")
@@ -185,7 +124,7 @@ def generate_csv_files(all_floats, output_dir="addition/TT"):
     # Generate addition table (this might take a moment for 256x256 = 65,536 operations)
     print("\nGenerating addition table for all combinations...")
     start_time = time.time()
-    addition_results = generate_addition_table(list1, list2)
+    addition_results = generate_addition_table_bits(list1, list2)
     end_time = time.time()
     
     print(f"✓ Completed all {len(addition_results)} addition operations in {end_time - start_time:.2f} seconds")
@@ -212,14 +151,12 @@ def generate_csv_files(all_floats, output_dir="addition/TT"):
         f"{output_dir}/sample_addition_results.tt"
     )
     
-    # Also generate demo files
+    # The demo files have the same 16x16 content, so copy the sample files
     print("\nGenerating demo 16x16 files...")
-    save_operation_results_to_files_with_tt(
-        list1[:16], list2[:16],
-        f"{output_dir}/demo_addition_results.txt",
-        f"{output_dir}/demo_addition_results.csv",
-        f"{output_dir}/demo_addition_results.tt"
-    )
+    for extension in ("txt", "csv", "tt"):
+        demo_filename = f"{output_dir}/demo_addition_results.{extension}"
+        shutil.copyfile(f"{output_dir}/sample_addition_results.{extension}", demo_filename)
+        print(f"✓ Copied sample results to: {demo_filename}")
     
     return addition_results
 
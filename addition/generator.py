@@ -5,8 +5,60 @@ This module provides functions to generate all 256 possible Float_4E3M objects
 corresponding to all possible 8-bit patterns.
 """
 
+import numpy as np
 from typing import List
 from float_4e3m import Float_4E3M
+from conversion_utils import bits_to_values
+
+
+class Float4E3MArray:
+    """
+    Many Float_4E3M values stored as parallel arrays instead of objects.
+    
+    Holds the raw uint8 bit patterns and their float values side by side, so
+    bulk analysis works on two flat arrays rather than a list of instances.
+    """
+    
+    __slots__ = ('bits', 'values')
+    
+    def __init__(self, bits):
+        """
+        Initialize from 8-bit patterns.
+        
+        Args:
+            bits (list or np.ndarray): Bit patterns (0-255)
+        """
+        self.bits = np.asarray(bits, dtype=np.uint8)
+        self.values = bits_to_values(self.bits)
+    
+    @classmethod
+    def from_objects(cls, float_list: List[Float_4E3M]) -> 'Float4E3MArray':
+        """
+        Create from a list of Float_4E3M objects.
+        
+        Args:
+            float_list (List[Float_4E3M]): Objects to pack
+            
+        Returns:
+            Float4E3MArray: Array holding the same bit patterns
+        """
+        return cls([f.to_bits() for f in float_list])
+    
+    def __len__(self) -> int:
+        return len(self.bits)
+
+
+def generate_all_float_4e3m_bits() -> np.ndarray:
+    """
+    Generate all 256 Float_4E3M values as packed 8-bit patterns.
+    
+    Bit-level code (e.g. operations.add_table) can work on this array directly
+    and only materialize Float_4E3M objects where callers need them.
+    
+    Returns:
+        np.ndarray: uint8 array of the bit patterns 0-255
+    """
+    return np.arange(256, dtype=np.uint8)
 
 
 def generate_all_float_4e3m() -> List[Float_4E3M]:
@@ -16,13 +68,8 @@ def generate_all_float_4e3m() -> List[Float_4E3M]:
     Returns:
         List[Float_4E3M]: List containing all 256 possible Float_4E3M objects
     """
-    all_floats = []
-    
-    for bit_pattern in range(256):
-        float_obj = Float_4E3M.from_bits(bit_pattern)
-        all_floats.append(float_obj)
-    
-    return all_floats
+    # from_bits already interns one instance per pattern; hand out those
+    return Float_4E3M.all_instances()
 
 
 def print_all_representations(float_list: List[Float_4E3M], max_display: int = 20) -> None:
@@ -47,26 +94,31 @@ def print_all_representations(float_list: List[Float_4E3M], max_display: int = 2
         print(f"... and {len(float_list) - max_display} more objects")
 
 
-def analyze_value_distribution(float_list: List[Float_4E3M]) -> None:
+def analyze_value_distribution(float_list) -> None:
     """
     Analyze the distribution of values in the Float_4E3M representation.
     
     Args:
-        float_list (List[Float_4E3M]): List of Float_4E3M objects to analyze
+        float_list (List[Float_4E3M] or Float4E3MArray): Values to analyze
     """
-    values = [f.value for f in float_list]
+    if not isinstance(float_list, Float4E3MArray):
+        float_list = Float4E3MArray.from_objects(float_list)
+    values = float_list.values
+    
+    min_value = float(values.min())
+    max_value = float(values.max())
     
     print("\nValue Distribution Analysis:")
     print("-" * 40)
-    print(f"Total unique values: {len(set(values))}")
-    print(f"Minimum value: {min(values)}")
-    print(f"Maximum value: {max(values)}")
-    print(f"Value range: {max(values) - min(values)}")
+    print(f"Total unique values: {np.unique(values).size}")
+    print(f"Minimum value: {min_value}")
+    print(f"Maximum value: {max_value}")
+    print(f"Value range: {max_value - min_value}")
     
     # Count positive and negative values
-    positive_count = sum(1 for v in values if v > 0)
-    negative_count = sum(1 for v in values if v < 0)
-    zero_count = sum(1 for v in values if v == 0)
+    positive_count = int((values > 0).sum())
+    negative_count = int((values < 0).sum())
+    zero_count = int((values == 0).sum())
     
     print(f"Positive values: {positive_count}")
     print(f"Negative values: {negative_count}")
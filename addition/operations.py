@@ -6,10 +6,53 @@ Currently implements addition, with structure for future operations.
 Includes functionality to save results in text and CSV formats.
 """
 
-import csv
 from typing import List, Tuple, Dict
 import itertools
+import numpy as np
 from float_4e3m import Float_4E3M
+from conversion_utils import bitstream_to_value, bits_to_value, bits_to_values
+
+
+def _ascii_codes(strings) -> np.ndarray:
+    """
+    Pack ASCII strings into a matrix of byte codes.
+    
+    Args:
+        strings: Sequence of ASCII strings
+        
+    Returns:
+        np.ndarray: uint8 array of shape (len(strings), longest length), with
+            shorter strings padded by NUL bytes
+    """
+    codes = np.array([string.encode('ascii') for string in strings], dtype=bytes)
+    return codes.view(np.uint8).reshape(len(strings), codes.itemsize)
+
+
+# 8-bit binary string for every bit pattern, indexed by the pattern itself
+_BITSTRING_TABLE = tuple(f"{bits:08b}" for bits in range(256))
+
+# CSV text of every pattern's value, and the CSV header row. Bitstrings and
+# float reprs never need quoting, so rows can be joined directly with the
+# same "\r\n" terminator csv.writer uses.
+_CSV_VALUE_TABLE = tuple(str(bits_to_value(bits)) for bits in range(256))
+_CSV_HEADER = "operand1,operand2,result,value1,value2,result_value"
+
+# ASCII codes of the bitstrings and CSV values, for assembling rows as bytes
+_BITSTRING_CODES = _ascii_codes(_BITSTRING_TABLE)
+_CSV_VALUE_CODES = _ascii_codes(_CSV_VALUE_TABLE)
+
+# Result files are formatted and written this many rows at a time, through a
+# buffer of this many bytes
+_WRITE_CHUNK_ROWS = 4096
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Elementwise NumPy equivalents of the supported operations on float values
+_NUMPY_OPERATIONS = {
+    'add': np.add,
+    'subtract': np.subtract,
+    'multiply': np.multiply,
+    'divide': np.divide,
+}
 
 
 class Float4E3MOperations:
@@ -85,93 +128,192 @@ class Float4E3MOperations:
         return Float_4E3M.from_value(result_value)
 
 
-def save_addition_results_to_files(list1: List[Float_4E3M], list2: List[Float_4E3M], 
-                                   text_filename: str = "addition_results.txt",
-                                   csv_filename: str = "addition_results.csv",
-                                   decimal_places: int = 10) -> List[Tuple[str, str, str]]:
+def _exact_table(list1: List[Float_4E3M], list2: List[Float_4E3M], operation: str) -> np.ndarray:
     """
-    Generate addition table and save results to both text and CSV files.
+    Apply an operation to the float values of every pair of operands at once.
+    
+    Uses a NumPy ufunc over the outer product of the operand values, which
+    gives the same IEEE results as the per-pair Python float operations.
+    Pairs that would divide by zero are set to 0.0; callers skip them.
     
     Args:
-        list1 (List[Float_4E3M]): First list of Float_4E3M objects
-        list2 (List[Float_4E3M]): Second list of Float_4E3M objects
-        text_filename (str): Name for the text output file
-        csv_filename (str): Name for the CSV output file
-        decimal_places (int): Number of decimal places to show in text file (default: 10)
+        list1 (List[Float_4E3M]): First operand list
+        list2 (List[Float_4E3M]): Second operand list
+        operation (str): 'add', 'subtract', 'multiply' or 'divide'
         
     Returns:
-        List[Tuple[str, str, str]]: List of (bitstream1, bitstream2, result_bitstream) tuples
+        np.ndarray: float64 array of shape (len(list1), len(list2))
     """
-    addition_results = []
+    values1 = np.array([x1.value for x1 in list1], dtype=np.float64)
+    values2 = np.array([x2.value for x2 in list2], dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        exact_matrix = _NUMPY_OPERATIONS[operation](values1[:, None], values2[None, :])
+    if operation == 'divide':
+        exact_matrix[:, values2 == 0] = 0.0
+    return exact_matrix
+
+
+def _binop_table(list1: List[Float_4E3M], list2: List[Float_4E3M], operation: str) -> np.ndarray:
+    """
+    Apply an operation to every pair of operands at once.
     
-    # Prepare data for both formats
-    text_lines = []
-    csv_data = []
+    Rounds the exact results from _exact_table with
+    Float_4E3M.from_value_array, matching the per-pair Float4E3MOperations
+    methods. Pairs that would divide by zero get the pattern for 0.0;
+    callers skip them.
     
+    Args:
+        list1 (List[Float_4E3M]): First operand list
+        list2 (List[Float_4E3M]): Second operand list
+        operation (str): 'add', 'subtract', 'multiply' or 'divide'
+        
+    Returns:
+        np.ndarray: uint8 array of shape (len(list1), len(list2))
+    """
+    return Float_4E3M.from_value_array(_exact_table(list1, list2, operation))
+
+
+def _table_text(pieces, shape: Tuple[int, int]) -> str:
+    """
+    Format every row of a result table in one vectorized pass.
+    
+    Each piece is a bytes literal shared by every row or a uint8 code array
+    (see _ascii_codes) that broadcasts to shape + (width,). The pieces are
+    laid side by side as fixed-width records, then the NUL padding is
+    dropped, leaving the rows in order with no per-row Python work.
+    
+    Args:
+        pieces: Row layout as bytes literals and code arrays
+        shape (Tuple[int, int]): (operand1 count, operand2 count) of the rows
+        
+    Returns:
+        str: The formatted rows
+    """
+    columns = []
+    for piece in pieces:
+        if isinstance(piece, bytes):
+            piece = np.frombuffer(piece, dtype=np.uint8)
+        columns.append(np.broadcast_to(piece, shape + piece.shape[-1:]))
+    records = np.concatenate(columns, axis=-1)
+    return records[records != 0].tobytes().decode('ascii')
+
+
+def _write_result_files(list1: List[Float_4E3M], list2: List[Float_4E3M], result_bits: np.ndarray,
+                        op_symbol: str, text_filename: str, csv_filename: str,
+                        decimal_places: int) -> None:
+    """
+    Save an operation table to a formatted text file and a CSV file.
+    
+    Rows are assembled from per-pattern byte tables (see _table_text), one band
+    of about _WRITE_CHUNK_ROWS rows at a time, and each band is emitted with a
+    single write.
+    
+    Args:
+        list1 (List[Float_4E3M]): First operand list
+        list2 (List[Float_4E3M]): Second operand list
+        result_bits (np.ndarray): uint8 result patterns, shape (len(list1), len(list2))
+        op_symbol (str): Operator shown between the values in the text file
+        text_filename (str): Name for the text output file
+        csv_filename (str): Name for the CSV output file
+        decimal_places (int): Number of decimal places to show in text file
+    """
     # Header for text file (width depends on decimal places)
     separator_width = 50 + (decimal_places + 6) * 3  # Adjust width based on decimal places
     text_header = "Operand 1  | Operand 2  | Result     | Values"
     text_separator = "-" * separator_width
-    text_lines.append(text_header)
-    text_lines.append(text_separator)
-    
-    # Header for CSV file
-    csv_header = ["operand1", "operand2", "result", "value1", "value2", "result_value"]
-    csv_data.append(csv_header)
-    
-    # Generate all combinations and format results
-    for x1 in list1:
-        for x2 in list2:
-            # Perform addition
-            result = Float4E3MOperations.add(x1, x2)
-            
-            # Get bitstreams
-            bits1 = x1.to_bitstring()
-            bits2 = x2.to_bitstring()
-            result_bits = result.to_bitstring()
-            
-            # Get values
-            val1 = x1.value
-            val2 = x2.value
-            result_val = result.value
-            
-            # Store for return
-            addition_results.append((bits1, bits2, result_bits))
-            
-            # Format for text file with configurable decimal places
-            field_width = decimal_places + 6  # Add space for sign, digits before decimal, and decimal point
-            format_str = f"{{val:.{decimal_places}f}}"
-            
-            val1_str = f"{val1:{field_width}.{decimal_places}f}"
-            val2_str = f"{val2:{field_width}.{decimal_places}f}"
-            result_str = f"{result_val:{field_width}.{decimal_places}f}"
-            
-            text_line = f"{bits1} | {bits2} | {result_bits} | {val1_str} + {val2_str} = {result_str}"
-            text_lines.append(text_line)
-            
-            # Format for CSV file
-            csv_row = [bits1, bits2, result_bits, val1, val2, result_val]
-            csv_data.append(csv_row)
+    
+    # Format for text file with configurable decimal places; every value an
+    # operand or result can take is formatted once, indexed by its pattern
+    field_width = decimal_places + 6  # Add space for sign, digits before decimal, and decimal point
+    format_value = f"{{:{field_width}.{decimal_places}f}}".format
+    text_values = _ascii_codes([format_value(bits_to_value(bits)) for bits in range(256)])
+    
+    op1_bits = np.array([x1.to_bits() for x1 in list1], dtype=np.uint8)
+    op2_bits = np.array([x2.to_bits() for x2 in list2], dtype=np.uint8)
+    band_rows = max(1, _WRITE_CHUNK_ROWS // max(1, op2_bits.size))
+    bands = [slice(start, start + band_rows) for start in range(0, op1_bits.size, band_rows)]
+    
+    def text_band(band):
+        bits1 = op1_bits[band, None]
+        results = result_bits[band]
+        return _table_text((
+            _BITSTRING_CODES[bits1], b" | ", _BITSTRING_CODES[op2_bits][None], b" | ",
+            _BITSTRING_CODES[results], b" | ", text_values[bits1], f" {op_symbol} ".encode('ascii'),
+            text_values[op2_bits][None], b" = ", text_values[results], b"\n",
+        ), results.shape)
+    
+    def csv_band(band):
+        bits1 = op1_bits[band, None]
+        results = result_bits[band]
+        return _table_text((
+            _BITSTRING_CODES[bits1], b",", _BITSTRING_CODES[op2_bits][None], b",",
+            _BITSTRING_CODES[results], b",", _CSV_VALUE_CODES[bits1], b",",
+            _CSV_VALUE_CODES[op2_bits][None], b",", _CSV_VALUE_CODES[results], b"\r\n",
+        ), results.shape)
     
     # Write text file
     try:
-        with open(text_filename, 'w', encoding='utf-8') as f:
-            for line in text_lines:
-                f.write(line + '\n')
+        with open(text_filename, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(f"{text_header}\n{text_separator}\n")
+            for band in bands:
+                f.write(text_band(band))
         print(f"✓ Text results saved to: {text_filename}")
     except Exception as e:
         print(f"✗ Error writing text file: {e}")
     
     # Write CSV file
     try:
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerows(csv_data)
+        with open(csv_filename, 'w', newline='', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            f.write(_CSV_HEADER + "\r\n")
+            for band in bands:
+                f.write(csv_band(band))
         print(f"✓ CSV results saved to: {csv_filename}")
     except Exception as e:
         print(f"✗ Error writing CSV file: {e}")
+
+
+def _result_tuples(list1: List[Float_4E3M], list2: List[Float_4E3M],
+                   result_bits: np.ndarray) -> List[Tuple[str, str, str]]:
+    """
+    List an operation table as (bitstream1, bitstream2, result_bitstream) tuples.
     
-    return addition_results
+    Args:
+        list1 (List[Float_4E3M]): First operand list
+        list2 (List[Float_4E3M]): Second operand list
+        result_bits (np.ndarray): uint8 result patterns, shape (len(list1), len(list2))
+        
+    Returns:
+        List[Tuple[str, str, str]]: One tuple per pair, row by row
+    """
+    bits2_list = [x2.to_bitstring() for x2 in list2]
+    return [(bits1, bits2, _BITSTRING_TABLE[result_pattern])
+            for bits1, result_row in zip((x1.to_bitstring() for x1 in list1), result_bits.tolist())
+            for bits2, result_pattern in zip(bits2_list, result_row)]
+
+
+def save_addition_results_to_files(list1: List[Float_4E3M], list2: List[Float_4E3M], 
+                                   text_filename: str = "addition_results.txt",
+                                   csv_filename: str = "addition_results.csv",
+                                   decimal_places: int = 10) -> List[Tuple[str, str, str]]:
+    """
+    Generate addition table and save results to both text and CSV files.
+    
+    Args:
+        list1 (List[Float_4E3M]): First list of Float_4E3M objects
+        list2 (List[Float_4E3M]): Second list of Float_4E3M objects
+        text_filename (str): Name for the text output file
+        csv_filename (str): Name for the CSV output file
+        decimal_places (int): Number of decimal places to show in text file (default: 10)
+        
+    Returns:
+        List[Tuple[str, str, str]]: List of (bitstream1, bitstream2, result_bitstream) tuples
+    """
+    # Perform every addition in one vectorized pass
+    result_bits = _binop_table(list1, list2, 'add')
+    
+    _write_result_files(list1, list2, result_bits, '+', text_filename, csv_filename, decimal_places)
+    
+    return _result_tuples(list1, list2, result_bits)
 
 
 def save_operation_results_to_files(list1: List[Float_4E3M], list2: List[Float_4E3M], 
@@ -210,85 +352,97 @@ def save_operation_results_to_files(list1: List[Float_4E3M], list2: List[Float_4
     if operation not in operations_map:
         raise ValueError(f"Unsupported operation: {operation}")
     
-    op_func, op_symbol = operations_map[operation]
-    operation_results = []
+    op_symbol = operations_map[operation][1]
     
-    # Prepare data for both formats
-    text_lines = []
-    csv_data = []
+    # Division by zero is skipped, so drop zero divisors up front instead of
+    # checking every pair
+    if operation == 'divide':
+        list2 = [x2 for x2 in list2 if x2.value != 0]
     
-    # Header for text file (width depends on decimal places)
-    separator_width = 50 + (decimal_places + 6) * 3  # Adjust width based on decimal places
-    text_header = "Operand 1  | Operand 2  | Result     | Values"
-    text_separator = "-" * separator_width
-    text_lines.append(text_header)
-    text_lines.append(text_separator)
-    
-    # Header for CSV file
-    csv_header = ["operand1", "operand2", "result", "value1", "value2", "result_value"]
-    csv_data.append(csv_header)
-    
-    # Generate all combinations and format results
-    for x1 in list1:
-        for x2 in list2:
-            try:
-                # Skip division by zero
-                if operation == 'divide' and x2.value == 0:
-                    continue
-                
-                # Perform operation
-                result = op_func(x1, x2)
-                
-                # Get bitstreams
-                bits1 = x1.to_bitstring()
-                bits2 = x2.to_bitstring()
-                result_bits = result.to_bitstring()
-                
-                # Get values
-                val1 = x1.value
-                val2 = x2.value
-                result_val = result.value
-                
-                # Store for return
-                operation_results.append((bits1, bits2, result_bits))
-                
-                # Format for text file with configurable decimal places
-                field_width = decimal_places + 6  # Add space for sign, digits before decimal, and decimal point
-                
-                val1_str = f"{val1:{field_width}.{decimal_places}f}"
-                val2_str = f"{val2:{field_width}.{decimal_places}f}"
-                result_str = f"{result_val:{field_width}.{decimal_places}f}"
-                
-                text_line = f"{bits1} | {bits2} | {result_bits} | {val1_str} {op_symbol} {val2_str} = {result_str}"
-                text_lines.append(text_line)
-                
-                # Format for CSV file
-                csv_row = [bits1, bits2, result_bits, val1, val2, result_val]
-                csv_data.append(csv_row)
-                
-            except (ZeroDivisionError, OverflowError) as e:
-                # Skip problematic operations
-                continue
+    # Perform the operation on every pair in one vectorized pass
+    result_bits = _binop_table(list1, list2, operation)
     
-    # Write text file
-    try:
-        with open(text_filename, 'w', encoding='utf-8') as f:
-            for line in text_lines:
-                f.write(line + '\n')
-        print(f"✓ Text results saved to: {text_filename}")
-    except Exception as e:
-        print(f"✗ Error writing text file: {e}")
+    _write_result_files(list1, list2, result_bits, op_symbol, text_filename, csv_filename, decimal_places)
     
-    # Write CSV file
-    try:
-        with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerows(csv_data)
-        print(f"✓ CSV results saved to: {csv_filename}")
-    except Exception as e:
-        print(f"✗ Error writing CSV file: {e}")
+    return _result_tuples(list1, list2, result_bits)
+
+
+def add_table(op1_bits, op2_bits) -> np.ndarray:
+    """
+    Add every pair of Float_4E3M bit patterns without creating any objects.
     
-    return operation_results
+    Entry [i, j] equals (from_bits(op1_bits[i]) + from_bits(op2_bits[j])).to_bits(),
+    read straight from the Float_4E3M addition table.
+    
+    Args:
+        op1_bits (np.ndarray): uint8 bit patterns of the first operands
+        op2_bits (np.ndarray): uint8 bit patterns of the second operands
+        
+    Returns:
+        np.ndarray: uint8 array of shape (len(op1_bits), len(op2_bits))
+    """
+    op1_bits = np.asarray(op1_bits, dtype=np.uint8)
+    op2_bits = np.asarray(op2_bits, dtype=np.uint8)
+    return Float_4E3M.add_bits(op1_bits[:, None], op2_bits[None, :])
+
+
+class AdditionTable:
+    """
+    Addition results for every pair of two operand lists, stored as bit patterns.
+    
+    result_bits[i, j] is the pattern of list1[i] + list2[j], so a full
+    256x256 table takes 64 KB in one uint8 array. iter_tuples() produces the
+    (bitstream1, bitstream2, result_bitstream) tuples of generate_addition_table
+    on demand for callers that need them.
+    """
+    
+    __slots__ = ('op1_bits', 'op2_bits', 'result_bits')
+    
+    def __init__(self, op1_bits, op2_bits):
+        """
+        Add every pair of operand bit patterns.
+        
+        Args:
+            op1_bits (np.ndarray): uint8 bit patterns of the first operands
+            op2_bits (np.ndarray): uint8 bit patterns of the second operands
+        """
+        self.op1_bits = np.asarray(op1_bits, dtype=np.uint8)
+        self.op2_bits = np.asarray(op2_bits, dtype=np.uint8)
+        self.result_bits = add_table(self.op1_bits, self.op2_bits)
+    
+    def __len__(self) -> int:
+        return self.result_bits.size
+    
+    def iter_tuples(self):
+        """
+        Iterate over the results as bitstrings, row by row.
+        
+        Yields:
+            Tuple[str, str, str]: (bitstream1, bitstream2, result_bitstream)
+        """
+        bitstrings2 = [_BITSTRING_TABLE[bits2] for bits2 in self.op2_bits.tolist()]
+        for bits1, result_row in zip(self.op1_bits.tolist(), self.result_bits.tolist()):
+            bitstring1 = _BITSTRING_TABLE[bits1]
+            for bitstring2, result in zip(bitstrings2, result_row):
+                yield bitstring1, bitstring2, _BITSTRING_TABLE[result]
+
+
+def generate_addition_table_bits(list1: List[Float_4E3M], list2: List[Float_4E3M]) -> AdditionTable:
+    """
+    Generate addition table for all combinations of two Float_4E3M lists as
+    raw bit patterns.
+    
+    The result can be passed on (e.g. to analyze_addition_results) without
+    ever building the per-pair bitstring tuples.
+    
+    Args:
+        list1 (List[Float_4E3M]): First list of Float_4E3M objects
+        list2 (List[Float_4E3M]): Second list of Float_4E3M objects
+        
+    Returns:
+        AdditionTable: Operand and result bit patterns
+    """
+    return AdditionTable([x1.to_bits() for x1 in list1], [x2.to_bits() for x2 in list2])
 
 
 def generate_addition_table(list1: List[Float_4E3M], list2: List[Float_4E3M]) -> List[Tuple[str, str, str]]:
@@ -302,18 +456,7 @@ def generate_addition_table(list1: List[Float_4E3M], list2: List[Float_4E3M]) ->
     Returns:
         List[Tuple[str, str, str]]: List of (bitstream1, bitstream2, result_bitstream) tuples
     """
-    addition_results = []
-    
-    for x1 in list1:
-        for x2 in list2:
-            result = Float4E3MOperations.add(x1, x2)
-            addition_results.append((
-                x1.to_bitstring(),
-                x2.to_bitstring(),
-                result.to_bitstring()
-            ))
-    
-    return addition_results
+    return list(generate_addition_table_bits(list1, list2).iter_tuples())
 
 
 def create_operation_matrix(list1: List[Float_4E3M], list2: List[Float_4E3M], 
@@ -339,42 +482,45 @@ def create_operation_matrix(list1: List[Float_4E3M], list2: List[Float_4E3M],
     if operation not in operations_map:
         raise ValueError(f"Unsupported operation: {operation}")
     
-    op_func = operations_map[operation]
     results = []
-    overflow_count = 0
-    underflow_count = 0
-    
-    for x1 in list1:
-        for x2 in list2:
-            try:
-                if operation == 'divide' and x2.value == 0:
-                    continue  # Skip division by zero
-                
-                result = op_func(x1, x2)
-                
-                # Check for potential overflow/underflow by comparing
-                # the exact mathematical result with the quantized result
-                exact_result = getattr(x1.value, f"__{operation}__")(x2.value) if operation != 'divide' else x1.value / x2.value
-                
-                if abs(exact_result) > abs(result.value) * 2:  # Rough overflow detection
-                    overflow_count += 1
-                elif abs(exact_result) > 0 and abs(result.value) < abs(exact_result) / 2:  # Rough underflow detection
-                    underflow_count += 1
-                
-                results.append({
-                    'operand1_bits': x1.to_bitstring(),
-                    'operand1_value': x1.value,
-                    'operand2_bits': x2.to_bitstring(),
-                    'operand2_value': x2.value,
-                    'result_bits': result.to_bitstring(),
-                    'result_value': result.value,
-                    'exact_result': exact_result,
-                    'quantization_error': abs(exact_result - result.value)
-                })
-            
-            except (ZeroDivisionError, OverflowError) as e:
-                # Handle exceptions gracefully
-                continue
+    
+    # Skip division by zero by dropping zero divisors up front
+    if operation == 'divide':
+        list2 = [x2 for x2 in list2 if x2.value != 0]
+    
+    # Compute every exact result, quantized result and error in one vectorized
+    # pass, so the loop below only assembles the per-pair records
+    exact_matrix = _exact_table(list1, list2, operation)
+    result_matrix = Float_4E3M.from_value_array(exact_matrix)
+    result_values = bits_to_values(result_matrix)
+    error_matrix = np.abs(exact_matrix - result_values)
+    
+    # Check for potential overflow/underflow by comparing
+    # the exact mathematical result with the quantized result
+    exact_magnitude = np.abs(exact_matrix)
+    result_magnitude = np.abs(result_values)
+    overflow = exact_magnitude > result_magnitude * 2  # Rough overflow detection
+    underflow = ~overflow & (exact_magnitude > 0) & (result_magnitude < exact_magnitude / 2)  # Rough underflow detection
+    overflow_count = int(overflow.sum())
+    underflow_count = int(underflow.sum())
+    
+    operands2 = [(x2.to_bitstring(), x2.value) for x2 in list2]
+    for x1, result_row, exact_row, error_row in zip(list1, result_matrix.tolist(),
+                                                     exact_matrix.tolist(), error_matrix.tolist()):
+        bits1 = x1.to_bitstring()
+        val1 = x1.value
+        for (bits2, val2), result_pattern, exact_result, error in zip(operands2, result_row,
+                                                                      exact_row, error_row):
+            results.append({
+                'operand1_bits': bits1,
+                'operand1_value': val1,
+                'operand2_bits': bits2,
+                'operand2_value': val2,
+                'result_bits': _BITSTRING_TABLE[result_pattern],
+                'result_value': bits_to_value(result_pattern),
+                'exact_result': exact_result,
+                'quantization_error': error
+            })
     
     return {
         'operation': operation,
@@ -386,20 +532,28 @@ def create_operation_matrix(list1: List[Float_4E3M], list2: List[Float_4E3M],
     }
 
 
-def analyze_addition_results(addition_results: List[Tuple[str, str, str]]) -> None:
+def analyze_addition_results(addition_results) -> None:
     """
     Analyze the results of addition operations.
     
     Args:
-        addition_results: List of (bitstream1, bitstream2, result_bitstream) tuples
+        addition_results: List of (bitstream1, bitstream2, result_bitstream) tuples,
+            or the AdditionTable from generate_addition_table_bits
     """
+    if isinstance(addition_results, AdditionTable):
+        # Count on the integer patterns; only the displayed rows become bitstrings
+        unique_count = np.unique(addition_results.result_bits).size
+        sample_results = list(itertools.islice(addition_results.iter_tuples(), 10))
+    else:
+        unique_count = len(set(result[2] for result in addition_results))
+        sample_results = addition_results[:10]
+    
     print("Addition Analysis")
     print("=" * 50)
     print(f"Total operations performed: {len(addition_results)}")
     
     # Count unique results
-    unique_results = set(result[2] for result in addition_results)
-    print(f"Unique result patterns: {len(unique_results)}")
+    print(f"Unique result patterns: {unique_count}")
     
     # Show sample results
     print("\nSample Addition Results:")
@@ -407,10 +561,10 @@ def analyze_addition_results(addition_results: List[Tuple[str, str, str]]) -> No
     print("Operand 1  | Operand 2  | Result     | Values")
     print("-" * 60)
     
-    for i, (bits1, bits2, result_bits) in enumerate(addition_results[:10]):
-        val1 = Float_4E3M.from_bits(int(bits1, 2)).value
-        val2 = Float_4E3M.from_bits(int(bits2, 2)).value
-        result_val = Float_4E3M.from_bits(int(result_bits, 2)).value
+    for i, (bits1, bits2, result_bits) in enumerate(sample_results):
+        val1 = bitstream_to_value(bits1)
+        val2 = bitstream_to_value(bits2)
+        result_val = bitstream_to_value(result_bits)
         
         print(f"{bits1} | {bits2} | {result_bits} | {val1:6.3f} + {val2:6.3f} = {result_val:6.3f}")
     
@@ -435,7 +589,7 @@ if __name__ == "__main__":
     
     # Generate addition table
     print("\nGenerating addition table...")
-    addition_results = generate_addition_table(list1, list2)
+    addition_results = generate_addition_table_bits(list1, list2)
     
     # Analyze results
     analyze_addition_results(addition_results)